@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Pooled document conversion with long-lived headless LibreOffice processes.
+
+Starting soffice cold for every conversion dominates validation time. A
+ConverterPool keeps a few office processes running and hands them jobs from
+a queue; each process is replaced after a number of jobs or when it crashes
+or hangs.
+
+Usage:
+    from ooxml.scripts.converter import ConverterPool
+
+    with ConverterPool(size=4) as pool:
+        ok = pool.validate("report.docx")
+        futures = [pool.submit(path, "out") for path in paths]
+        html_files = [future.result() for future in futures]
+
+    # Without LibreOffice (tests, CI): same interface, local checks only
+    from ooxml.scripts.converter import FakeConverter
+    pool = ConverterPool(size=2, converter_factory=FakeConverter)
+"""
+
+import concurrent.futures
+import os
+import queue
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import defusedxml.ElementTree
+
+# soffice --convert-to filters used to validate each format by HTML export
+HTML_FILTERS = {
+    ".docx": "html:HTML",
+    ".pptx": "html:impress_html_Export",
+    ".xlsx": "html:HTML (StarCalc)",
+}
+
+
+class ConverterCrashed(RuntimeError):
+    """The office process died or stopped responding during a job."""
+
+
+class ConversionTimeout(ConverterCrashed):
+    """A job ran past the converter's timeout (likely caused by the document)."""
+
+
+class SofficeConverter:
+    """One long-lived headless LibreOffice process with a private profile.
+
+    Conversions are not driven over UNO: the uno module only ships with
+    LibreOffice's own Python and is not importable from the interpreter
+    running these scripts. Instead each job runs `soffice --convert-to` with
+    the same -env:UserInstallation profile. LibreOffice keys its
+    single-instance pipe on the profile, so that client forwards the request
+    to the running office and exits when the conversion is done; it does not
+    load an office of its own, which is the startup cost the pool avoids.
+
+    The --accept socket is only a readiness probe: the office opens it once
+    startup has finished, so start() returns when a client can be forwarded.
+    """
+
+    def __init__(self, timeout=60, startup_timeout=60, executable="soffice"):
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self.executable = executable
+        self._process = None
+        self._profile = None
+
+    def start(self):
+        """Start the office process and wait until it accepts connections."""
+        self._profile = Path(tempfile.mkdtemp(prefix="soffice-profile-"))
+        port = _free_port()
+        self._process = subprocess.Popen(
+            [
+                self.executable,
+                *self._profile_args(),
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--nolockcheck",
+                "--norestore",
+                f"--accept=socket,host=127.0.0.1,port={port};urp;",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # Lets close() kill the whole process group
+        )
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if not self.alive():
+                self.close()
+                raise ConverterCrashed("soffice exited during startup")
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                return
+            except OSError:
+                time.sleep(0.1)
+        self.close()
+        raise ConverterCrashed(f"soffice did not start in {self.startup_timeout}s")
+
+    def alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def convert(self, doc_path, filter_name, outdir):
+        """Convert one document in the running office.
+
+        Returns:
+            Path: The converted file in outdir
+
+        Raises:
+            ValueError: If the document could not be converted
+            ConverterCrashed: If the office died or the job timed out
+        """
+        doc_path = Path(doc_path)
+        try:
+            result = subprocess.run(
+                [
+                    self.executable,
+                    *self._profile_args(),
+                    "--convert-to",
+                    filter_name,
+                    "--outdir",
+                    str(outdir),
+                    str(doc_path),
+                ],
+                capture_output=True,
+                timeout=self.timeout,
+                text=True,
+            )
+        except subprocess.TimeoutExpired:
+            raise ConversionTimeout(
+                f"Timeout after {self.timeout}s converting {doc_path}"
+            )
+
+        if not self.alive():
+            raise ConverterCrashed(f"soffice exited while converting {doc_path}")
+        output = Path(outdir) / f"{doc_path.stem}.{filter_name.split(':')[0]}"
+        if not output.exists():
+            raise ValueError(result.stderr.strip() or "Document conversion failed")
+        return output
+
+    def close(self):
+        """Stop the office process and remove its profile."""
+        if self._process is not None:
+            # Signal the group even if the launcher exited: soffice.bin may not have
+            _kill_group(self._process.pid, signal.SIGTERM)
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                _kill_group(self._process.pid, signal.SIGKILL)
+                self._process.wait()
+            self._process = None
+        if self._profile is not None:
+            shutil.rmtree(self._profile, ignore_errors=True)
+            self._profile = None
+
+    def _profile_args(self):
+        return [f"-env:UserInstallation={self._profile.as_uri()}", "--headless"]
+
+
+class FakeConverter:
+    """Stand-in for SofficeConverter that needs no LibreOffice.
+
+    Checks what can be checked locally (the file is a zip package with
+    [Content_Types].xml and well-formed XML parts) and writes a stub output
+    file. crash_after simulates an office process that dies on its Nth job,
+    to exercise recycling.
+    """
+
+    def __init__(self, delay=0.0, crash_after=None):
+        self.delay = delay
+        self.crash_after = crash_after
+        self.jobs = 0
+        self._running = False
+
+    def start(self):
+        self._running = True
+
+    def alive(self):
+        return self._running
+
+    def convert(self, doc_path, filter_name, outdir):
+        doc_path = Path(doc_path)
+        self.jobs += 1
+        if self.crash_after is not None and self.jobs >= self.crash_after:
+            self._running = False
+            raise ConverterCrashed(f"Fake converter crashed on {doc_path}")
+        time.sleep(self.delay)
+
+        try:
+            with zipfile.ZipFile(doc_path) as zf:
+                names = zf.namelist()
+                if "[Content_Types].xml" not in names:
+                    raise ValueError("Missing [Content_Types].xml")
+                for name in names:
+                    if name.endswith((".xml", ".rels")):
+                        defusedxml.ElementTree.fromstring(zf.read(name))
+        except (zipfile.BadZipFile, defusedxml.ElementTree.ParseError) as e:
+            raise ValueError(f"{doc_path.name}: {e}")
+
+        output = Path(outdir) / f"{doc_path.stem}.{filter_name.split(':')[0]}"
+        output.write_text(f"<html><!-- {doc_path.name} --></html>")
+        return output
+
+    def close(self):
+        self._running = False
+
+
+class ConverterPool:
+    """A fixed number of converters serving a queue of conversion jobs.
+
+    Jobs run on `size` threads, each borrowing an idle converter. Converters
+    start on first use and are replaced after jobs_per_worker jobs or when
+    they crash or time out. A job whose converter crashed is retried once on
+    a fresh one; a job that timed out is not.
+    Methods are safe to call from several threads.
+
+    Args:
+        size: Number of office processes
+        jobs_per_worker: Jobs after which a converter is restarted, releasing
+            memory LibreOffice accumulates (None: never)
+        converter_factory: Callable returning a new converter, e.g.
+            SofficeConverter (default), FakeConverter or a functools.partial
+            of either with options such as timeout
+    """
+
+    def __init__(self, size=2, jobs_per_worker=50, converter_factory=SofficeConverter):
+        self.jobs_per_worker = jobs_per_worker
+        self._factory = converter_factory
+        self._idle = queue.Queue()
+        self._workers = [_Worker() for _ in range(size)]
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            size, thread_name_prefix="converter"
+        )
+
+    def submit(self, doc_path, outdir, filter_name=None):
+        """Queue a conversion.
+
+        Args:
+            doc_path: Office file to convert
+            outdir: Directory for the converted file
+            filter_name: soffice --convert-to filter (default: HTML export
+                for the file type, see HTML_FILTERS)
+
+        Returns:
+            concurrent.futures.Future: Resolves to the Path of the converted
+            file, or raises ValueError (conversion failed) or ConverterCrashed
+            (the retry crashed too)
+        """
+        return self._executor.submit(self.convert, doc_path, outdir, filter_name)
+
+    def convert(self, doc_path, outdir, filter_name=None):
+        """Convert a document, waiting for a free converter. See submit()."""
+        doc_path = Path(doc_path)
+        if filter_name is None:
+            filter_name = _html_filter(doc_path)
+
+        worker = self._idle.get()
+        try:
+            for attempt in range(2):
+                try:
+                    converter = self._ready_converter(worker)
+                    return converter.convert(doc_path, filter_name, outdir)
+                except ConverterCrashed as e:
+                    # The office is replaced either way; a hang is not retried
+                    # since the same document would most likely hang again
+                    self._retire(worker)
+                    if attempt or isinstance(e, ConversionTimeout):
+                        raise
+                finally:
+                    worker.jobs += 1
+        finally:
+            self._idle.put(worker)
+
+    def validate(self, doc_path):
+        """Check that a document converts to HTML, like pack.validate_document."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                self.convert(doc_path, temp_dir)
+                return True
+            except FileNotFoundError:
+                print(
+                    "Warning: soffice not found. Skipping validation.", file=sys.stderr
+                )
+                return True
+            except (ValueError, ConverterCrashed) as e:
+                print(f"Validation error: {e}", file=sys.stderr)
+                return False
+
+    def close(self):
+        """Wait for queued jobs, then stop all converters."""
+        self._executor.shutdown(wait=True)
+        for worker in self._workers:
+            self._retire(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _ready_converter(self, worker):
+        """Return the worker's converter, (re)starting it when needed."""
+        converter = worker.converter
+        if converter is not None and (
+            not converter.alive()
+            or (self.jobs_per_worker and worker.jobs >= self.jobs_per_worker)
+        ):
+            self._retire(worker)
+        if worker.converter is None:
+            worker.converter = self._factory()
+            worker.converter.start()
+            worker.jobs = 0
+        return worker.converter
+
+    @staticmethod
+    def _retire(worker):
+        if worker.converter is not None:
+            worker.converter.close()
+            worker.converter = None
+
+
+class _Worker:
+    """Pool slot: the current converter and the jobs it has run."""
+
+    def __init__(self):
+        self.converter = None
+        self.jobs = 0
+
+
+def _html_filter(doc_path):
+    try:
+        return HTML_FILTERS[Path(doc_path).suffix.lower()]
+    except KeyError:
+        raise ValueError(f"{doc_path} must be a .docx, .pptx, or .xlsx file")
+
+
+def _kill_group(pid, sig):
+    try:
+        os.killpg(pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def _free_port():
+    """Pick a free local TCP port for an office listener."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -7,13 +7,90 @@ Example usage:
 """
 
 import argparse
+import codecs
+import contextlib
+import copy
+import hashlib
+import inspect
+import multiprocessing
+import re
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
 import zipfile
 from pathlib import Path
+from typing import NamedTuple
+from xml.parsers import expat
+
+# Whitespace-only text between two tags
+_WHITESPACE_BETWEEN_TAGS = re.compile(rb">\s+<")
+
+# Element name of a start tag, and the encoding in an XML declaration
+_TAG_NAME = re.compile(r"<([^\s/>]+)")
+_DECLARED_ENCODING = re.compile(r"""encoding\s*=\s*(["'])([^"']*)\1""")
+
+# Local names of elements whose whitespace-only content is document text
+_TEXT_ELEMENTS = {"t", "delText", "instrText", "delInstrText"}
+
+# With workers=None, packages with fewer XML parts than this are condensed
+# serially: starting worker processes costs more than it saves
+_PARALLEL_MIN_PARTS = 32
+
+# Timestamp of every member in deterministic mode (the earliest zip date)
+_FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Already-compressed formats (images, audio/video, embedded packages) that
+# deflate cannot shrink; they are stored as-is
+STORED_EXTENSIONS = frozenset(
+    {
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".wdp",
+        ".hdp",
+        ".jxr",
+        ".emz",
+        ".wmz",
+        ".svgz",
+        ".mp3",
+        ".m4a",
+        ".wma",
+        ".mp4",
+        ".m4v",
+        ".mov",
+        ".wmv",
+        ".zip",
+        ".docx",
+        ".docm",
+        ".xlsx",
+        ".xlsm",
+        ".pptx",
+        ".pptm",
+    }
+)
+
+
+class CompressionProfile(NamedTuple):
+    """How pack_document compresses archive members.
+
+    Levels are zlib deflate levels (0 stores, 1 is fastest, 9 smallest).
+    """
+
+    xml_level: int  # XML and .rels parts
+    other_level: int  # Other parts, e.g. EMF/WMF images, fonts, binary parts
+    stored_extensions: frozenset = STORED_EXTENSIONS
+
+
+# Office only reads stored and deflated members, so profiles differ in level only
+COMPRESSION_PROFILES = {
+    "standard": CompressionProfile(xml_level=6, other_level=6),
+    "smallest": CompressionProfile(xml_level=9, other_level=9),
+    "draft": CompressionProfile(xml_level=1, other_level=1),
+}
 
 
 def main():
@@ -21,11 +98,32 @@ def main():
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Condensing processes (default: CPU count for large packages)",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=sorted(COMPRESSION_PROFILES),
+        default="standard",
+        help="Compression profile (default: standard; draft packs fastest)",
+    )
+    parser.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="Write byte-identical output for identical content and print its SHA-256",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            workers=args.workers,
+            compression=args.compression,
+            deterministic=args.deterministic,
         )
 
         # Show warning if validation was skipped
@@ -38,17 +136,45 @@ def main():
             print("Use --force to skip validation and pack anyway.", file=sys.stderr)
             sys.exit(1)
 
+        # Same format as sha256sum
+        if args.deterministic:
+            print(f"{content_hash(args.output_file)}  {args.output_file}")
+
     except ValueError as e:
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(
+    input_dir,
+    output_file,
+    validate=False,
+    workers=None,
+    compression="standard",
+    deterministic=False,
+    converter_pool=None,
+):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    XML parts are condensed in memory (by worker processes for packages
+    with many parts) and written straight into the archive; other files are
+    streamed in unchanged. The input directory is never modified.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        workers: Number of condensing processes (default: CPU count for
+            packages with many XML parts, otherwise 1). Ignored inside
+            daemonic processes such as multiprocessing.Pool workers
+        compression: Name in COMPRESSION_PROFILES ("standard", "smallest",
+            "draft") or a CompressionProfile. Every profile stores
+            already-compressed media such as JPEG and PNG images
+        deterministic: If True, identical content always packs to identical
+            bytes: members are sorted with [Content_Types].xml first and
+            carry fixed timestamps and permissions. Use content_hash() on
+            the output to dedupe or cache packed documents
+        converter_pool: Optional converter.ConverterPool to validate with
+            long-lived office processes instead of a fresh soffice per call
 
     Returns:
         bool: True if successful, False if validation failed
@@ -60,35 +186,152 @@ def pack_document(input_dir, output_file, validate=False):
         raise ValueError(f"{input_dir} is not a directory")
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
+    profile = _compression_profile(compression)
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+    files = [f for f in input_dir.rglob("*") if f.is_file()]
+    if deterministic:
+        files.sort(key=lambda f: _member_order(f.relative_to(input_dir).as_posix()))
+    xml_files = [f for f in files if f.name.endswith((".xml", ".rels"))]
 
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Create final Office file as zip archive
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with _condensed_parts(xml_files, workers) as condensed:
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+            for f in files:
+                arcname = f.relative_to(input_dir).as_posix()
+                compress_type, level = member_compression(f.name, profile)
+                if f.name.endswith((".xml", ".rels")):
+                    # Results arrive in submission order, i.e. the order of files
+                    data = next(condensed)
+                elif deterministic:
+                    data = f.read_bytes()
+                else:
+                    # Streamed from disk with the file's own timestamp
+                    zf.write(f, arcname, compress_type, level)
+                    continue
+
+                if deterministic:
+                    info = _fixed_zip_info(arcname, len(data))
+                else:
+                    info = zipfile.ZipInfo.from_file(f, arcname)
+                info.compress_type = compress_type
+                zf.writestr(info, data, compresslevel=level)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file, pool=converter_pool):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
-def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+def content_hash(office_file):
+    """Return the SHA-256 hex digest of a packed file.
+
+    With pack_document(..., deterministic=True) the digest depends only on
+    the package content, so it can serve as a cache or dedupe key.
+    """
+    digest = hashlib.sha256()
+    with open(office_file, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _member_order(arcname):
+    """Sort key for deterministic packing: [Content_Types].xml, then by name."""
+    return (arcname != "[Content_Types].xml", arcname)
+
+
+def _fixed_zip_info(arcname, file_size):
+    """ZipInfo with the fixed metadata used for deterministic packing."""
+    info = zipfile.ZipInfo(arcname, date_time=_FIXED_DATE_TIME)
+    info.create_system = 3  # Unix, so external_attr is read as permissions
+    info.external_attr = 0o644 << 16
+    info.file_size = file_size
+    return info
+
+
+def member_compression(name, profile="standard"):
+    """Choose the compression for an archive member.
+
+    Args:
+        name: Member name or path; only its file name matters
+        profile: Name in COMPRESSION_PROFILES or a CompressionProfile
+
+    Returns:
+        tuple: (compress_type, compresslevel) for ZipFile.write/writestr
+    """
+    profile = _compression_profile(profile)
+    name = str(name).rsplit("/", 1)[-1]
+    if name.endswith((".xml", ".rels")):
+        level = profile.xml_level
+    elif Path(name).suffix.lower() in profile.stored_extensions:
+        level = 0
+    else:
+        level = profile.other_level
+    if level == 0:
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, level
+
+
+def _compression_profile(compression):
+    """Resolve a profile name to a CompressionProfile."""
+    if isinstance(compression, CompressionProfile):
+        return compression
+    if compression not in COMPRESSION_PROFILES:
+        raise ValueError(
+            f"Unknown compression profile {compression!r}; "
+            f"use one of {', '.join(COMPRESSION_PROFILES)}"
+        )
+    return COMPRESSION_PROFILES[compression]
+
+
+@contextlib.contextmanager
+def _condensed_parts(xml_files, workers):
+    """Yield an iterator of condensed XML bytes, one per file, in order.
+
+    With more than one worker the parts are condensed ahead of the consumer
+    in a process pool, so compression in the caller overlaps with parsing.
+    """
+    processes = _pool_size(workers, len(xml_files))
+    if processes <= 1:
+        yield map(_read_condensed, xml_files)
+        return
+    with multiprocessing.Pool(processes) as pool:
+        yield pool.imap(_read_condensed, xml_files)
+
+
+def _pool_size(workers, task_count):
+    """Return the number of condensing processes to start (1: run serially).
+
+    Daemonic processes, such as Document.map workers, cannot have children
+    and always run serially.
+    """
+    if multiprocessing.current_process().daemon:
+        return 1
+    if workers is None:
+        if task_count < _PARALLEL_MIN_PARTS:
+            return 1
+        workers = multiprocessing.cpu_count()
+    return max(1, min(workers, task_count))
+
+
+def _read_condensed(xml_file):
+    """Read an XML file and return its condensed bytes."""
+    return condense_xml_bytes(Path(xml_file).read_bytes())
+
+
+def validate_document(doc_path, pool=None):
+    """Validate document by converting to HTML with soffice.
+
+    With a converter.ConverterPool the conversion runs in one of its
+    long-lived office processes; otherwise a fresh soffice is started.
+    """
+    if pool is not None:
+        return pool.validate(doc_path)
+
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -132,27 +375,328 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    xml_file = Path(xml_file)
+    temp_file = xml_file.with_name(xml_file.name + ".condensed")
+    try:
+        with open(xml_file, "rb") as source, open(temp_file, "wb") as target:
+            condense_xml_stream(source, target)
+        temp_file.replace(xml_file)
+    finally:
+        temp_file.unlink(missing_ok=True)
+
+
+def condense_xml_bytes(content):
+    """Strip unnecessary whitespace and remove comments from XML bytes.
+
+    Args:
+        content: XML document as bytes
+
+    Returns:
+        bytes: Condensed XML, UTF-8 encoded
+    """
+    if _is_condensed(content):
+        return _strip_outer_whitespace(content)
+
+    output = []
+    _condense([content], output.append)
+    return b"".join(output)
+
+
+def condense_xml_stream(source, target, chunk_size=1 << 16):
+    """Condense XML from one binary file object into another.
+
+    Memory use is bounded by chunk_size plus the longest single tag or
+    whitespace run, so parts of any size can be condensed.
+
+    Args:
+        source: Binary file object to read XML from
+        target: Binary file object to write condensed UTF-8 XML to
+        chunk_size: Bytes read per step
+    """
+    _condense(iter(lambda: source.read(chunk_size), b""), target.write)
+
+
+def _condense(chunks, write):
+    """Condense XML arriving as an iterable of byte chunks."""
+    condenser = _XMLCondenser(write)
+    for chunk in _utf8_chunks(chunks):
+        condenser.feed(chunk)
+    condenser.feed(b"", final=True)
+
+
+def _utf8_chunks(chunks):
+    """Yield XML chunks as UTF-8, transcoding (and fixing the declaration) if needed.
+
+    UTF-8 input, and input without a declaration or BOM, passes through
+    untouched.
+    """
+    chunks = iter(chunks)
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if b">" in head or len(head) >= 1024:
+            break
+
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        encoding = "utf-16"
+    else:
+        declaration = head.split(b"?>", 1)[0] if head.startswith(b"<?xml") else b""
+        match = _DECLARED_ENCODING.search(declaration.decode("ascii", "replace"))
+        encoding = match.group(2) if match else "utf-8"
+    if encoding.lower() in ("utf-8", "utf8"):
+        yield head
+        yield from chunks
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    text = decoder.decode(head)
+    if text.startswith("<?xml"):
+        end = text.find("?>")
+        text = _DECLARED_ENCODING.sub('encoding="UTF-8"', text[:end], 1) + text[end:]
+    yield text.encode("utf-8")
+    for chunk in chunks:
+        yield decoder.decode(chunk).encode("utf-8")
+    yield decoder.decode(b"", True).encode("utf-8")
+
+
+class _XMLCondenser:
+    """Streaming condenser that copies kept source bytes through unchanged.
+
+    expat reports the byte offset of every event, so the input is cut into
+    consecutive segments (tags, text runs, comments, declarations) and each
+    one is either copied verbatim or dropped. Attribute quoting, entity and
+    character references and namespace declarations are never reserialized.
+    Comments are dropped, and so are text runs that are whitespace only,
+    unless they are the content of a text element such as w:t.
+    """
+
+    def __init__(self, write):
+        self._write = write
+        self._buffer = bytearray()
+        self._base = 0  # Source offset of _buffer[0]
+        self._copy_from = 0  # Start of the kept bytes not yet written
+        self._mark = 0  # Start of the current segment
+        self._keep = True  # Whether the current (non-text) segment is kept
+        self._text = False  # Whether the current segment is a text run
+        self._blank = True  # Whether that text run is whitespace only so far
+        self._cdata = False
+        self._keep_text = [False]  # Per open element: is whitespace content?
+
+        self._parser = expat.ParserCreate()
+        self._parser.StartElementHandler = self._start_element
+        self._parser.EndElementHandler = self._end_element
+        self._parser.CharacterDataHandler = self._characters
+        self._parser.CommentHandler = self._comment
+        self._parser.DefaultHandler = self._other
+        self._parser.StartDoctypeDeclHandler = self._forbid_dtd
+
+    def feed(self, data, final=False):
+        self._buffer += data
+        self._parser.Parse(data, final)
+        if final:
+            self._next_segment(self._base + len(self._buffer), keep=False)
+
+        # Write out what has been decided and forget it
+        if self._mark > self._copy_from:
+            self._write(self._slice(self._copy_from, self._mark))
+            self._copy_from = self._mark
+        del self._buffer[: self._mark - self._base]
+        self._base = self._mark
+
+    def _slice(self, start, end):
+        return bytes(self._buffer[start - self._base : end - self._base])
+
+    def _next_segment(self, index, keep, text=False):
+        """Decide the segment ending at index and start a new one there."""
+        if self._text:
+            keep_current = not self._blank or self._keep_text[-1]
+        else:
+            keep_current = self._keep
+        if not keep_current:
+            if self._mark > self._copy_from:
+                self._write(self._slice(self._copy_from, self._mark))
+            self._copy_from = index
+        self._mark = index
+        self._keep = keep
+        self._text = text
+        self._blank = True
+
+    def _start_element(self, name, attrs):
+        self._next_segment(self._parser.CurrentByteIndex, keep=True)
+        self._keep_text.append(name.rpartition(":")[2] in _TEXT_ELEMENTS)
+
+    def _end_element(self, name):
+        self._next_segment(self._parser.CurrentByteIndex, keep=True)
+        self._keep_text.pop()
+
+    def _characters(self, data):
+        if not self._text:
+            self._next_segment(self._parser.CurrentByteIndex, keep=True, text=True)
+        if self._blank and (self._cdata or data.strip()):
+            self._blank = False
+
+    def _comment(self, data):
+        self._next_segment(self._parser.CurrentByteIndex, keep=False)
+
+    def _other(self, data):
+        # Declarations, processing instructions, CDATA delimiters, and
+        # whitespace outside the root element (which is dropped)
+        keep = len(self._keep_text) > 1 or not data.isspace()
+        self._next_segment(self._parser.CurrentByteIndex, keep=keep)
+        if data == "<![CDATA[":
+            self._cdata = True
+        elif data == "]]>":
+            self._cdata = False
+
+    @staticmethod
+    def _forbid_dtd(*args):
+        raise ValueError("DTDs are not allowed in Office XML parts")
+
+
+def _is_condensed(content):
+    """Check that condensing would not change XML bytes, without parsing them.
+
+    True if there are no comments and all whitespace between tags is the
+    content of a text element (which condensing keeps), e.g. <w:t> </w:t>.
+    Whitespace outside the root element, such as the line break after the
+    XML declaration, is ignored (see _strip_outer_whitespace); a declared
+    encoding other than UTF-8 needs rewriting.
+    """
+    if b"<!--" in content or b"<!DOCTYPE" in content:
+        return False
+    if not content.startswith(b"<"):
+        return False  # BOM or UTF-16 content
+    start = 0
+    if content.startswith(b"<?xml"):
+        start = content.find(b"?>") + 2
+        declaration = content[:start].decode("ascii", "replace")
+        match = _DECLARED_ENCODING.search(declaration)
+        if match and match.group(2).lower() not in ("utf-8", "utf8"):
+            return False
+    for match in _WHITESPACE_BETWEEN_TAGS.finditer(content, start):
+        tag_start = content.rfind(b"<", 0, match.start())
+        tag = content[tag_start + 1 : match.start()]
+        name = tag.split(None, 1)[0] if tag else b""
+        local_name = name.rpartition(b":")[2].decode("ascii", "replace")
+        if (
+            tag.endswith(b"/")
+            or name.startswith(b"/")
+            or local_name not in _TEXT_ELEMENTS
+        ):
+            return False
+    return True
+
+
+def _strip_outer_whitespace(content):
+    """Drop whitespace after the XML declaration and after the root, as condensing does."""
+    start = content.find(b"?>") + 2 if content.startswith(b"<?xml") else 0
+    if content[start : start + 1].isspace() or content[-1:].isspace():
+        return content[:start] + content[start:].strip()
+    return content
+
+
+def copy_member_raw(source_zip, target_zip, info):
+    """Copy one member between open zip files, without recompressing it where possible.
+
+    On CPython, the compressed bytes are copied as-is and a fresh local header
+    is written with the CRC and sizes filled in. This relies on zipfile
+    internals; where they are missing (another Python implementation or
+    version) or the target is not seekable, the member is decompressed and
+    recompressed with the public API instead, keeping its compression method.
+
+    Args:
+        source_zip: zipfile.ZipFile opened for reading
+        target_zip: zipfile.ZipFile opened for writing
+        info: zipfile.ZipInfo of the member in source_zip
+
+    Raises:
+        ValueError: If the member is encrypted
+    """
+    if info.flag_bits & 0x1:
+        raise ValueError(f"Cannot copy encrypted member: {info.filename}")
+
+    if _RAW_COPY_SUPPORTED and _can_copy_raw(source_zip, target_zip):
+        _copy_compressed(source_zip, target_zip, info)
+    else:
+        _copy_recompressed(source_zip, target_zip, info)
+
+
+def _zipfile_internals_present():
+    """Check that zipfile has the internals _copy_compressed relies on."""
+    if sys.implementation.name != "cpython":
+        return False
+    names = (
+        "structFileHeader",
+        "sizeFileHeader",
+        "_FH_FILENAME_LENGTH",
+        "_FH_EXTRA_FIELD_LENGTH",
+    )
+    if not all(hasattr(zipfile, name) for name in names):
+        return False
+    try:
+        parameters = inspect.signature(zipfile.ZipInfo.FileHeader).parameters
+    except (TypeError, ValueError):
+        return False
+    return "zip64" in parameters
+
+
+_RAW_COPY_SUPPORTED = _zipfile_internals_present()
+
+
+def _can_copy_raw(source_zip, target_zip):
+    """Check that both open zip files expose the state _copy_compressed uses."""
+    if getattr(source_zip, "fp", None) is None:
+        return False
+    target_fp = getattr(target_zip, "fp", None)
+    if target_fp is None or not target_fp.seekable():
+        return False
+    names = ("start_dir", "filelist", "NameToInfo", "_didModify")
+    if not all(hasattr(target_zip, name) for name in names):
+        return False
+    # A write handle from ZipFile.open(..., "w") owns the file position
+    return not getattr(target_zip, "_writing", False)
+
+
+def _copy_compressed(source_zip, target_zip, info):
+    """Copy a member's compressed bytes as-is (CPython zipfile internals)."""
+    # Locate the compressed data after the source local header
+    source_fp = source_zip.fp
+    source_fp.seek(info.header_offset)
+    header = struct.unpack(
+        zipfile.structFileHeader, source_fp.read(zipfile.sizeFileHeader)
+    )
+    source_fp.seek(
+        header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], 1
+    )
+    data = source_fp.read(info.compress_size)
+
+    new_info = copy.copy(info)
+    new_info.flag_bits &= ~0x08  # CRC and sizes go in the local header
+    new_info.extra = b""  # Drop source zip64/alignment extras; recomputed as needed
+    target_fp = target_zip.fp
+    target_fp.seek(target_zip.start_dir)
+    new_info.header_offset = target_fp.tell()
+    target_fp.write(new_info.FileHeader(zip64=None))
+    target_fp.write(data)
+    target_zip.start_dir = target_fp.tell()
+    target_zip.filelist.append(new_info)
+    target_zip.NameToInfo[new_info.filename] = new_info
+    target_zip._didModify = True
+
+
+def _copy_recompressed(source_zip, target_zip, info):
+    """Copy a member through zipfile's public API, streaming its content."""
+    new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    new_info.compress_type = info.compress_type
+    new_info.create_system = info.create_system
+    new_info.external_attr = info.external_attr
+    new_info.comment = info.comment
+    if info.is_dir():
+        target_zip.writestr(new_info, b"")
+        return
+    new_info.file_size = info.file_size  # Lets zipfile decide on zip64 up front
+    with source_zip.open(info) as source, target_zip.open(new_info, "w") as target:
+        shutil.copyfileobj(source, target, 1 << 20)
 
 
 if __name__ == "__main__":
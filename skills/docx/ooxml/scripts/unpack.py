@@ -1,29 +1,190 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir>
+    python unpack.py --raw <office_file> <output_dir>  # Keep XML bytes as-is
+    python unpack.py --parts word/document.xml <office_file> <output_dir>
+
+    from ooxml.scripts.unpack import unpack_document
+    unpack_document("report.docx", "unpacked", parts=["word/document.xml"])
+"""
+
+import argparse
+import fnmatch
+import multiprocessing
 import random
-import sys
+import shutil
 import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+# Zip file opened once per formatting worker
+_worker_zip = None
+
+# With workers=None, files with fewer parts to format than this are formatted
+# serially: starting worker processes costs more than it saves
+_PARALLEL_MIN_PARTS = 32
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file")
+    parser.add_argument("input_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Skip pretty-printing; address nodes with get_path/get_node_by_path "
+        "or attributes instead of line numbers",
+    )
+    parser.add_argument(
+        "--parts",
+        nargs="+",
+        metavar="PATTERN",
+        help="Pretty-print only these parts (glob patterns such as word/document.xml "
+        "or word/*.xml); all other files are extracted as-is",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Formatting processes (default: CPU count for large files)",
+    )
+    args = parser.parse_args()
+
+    try:
+        unpack_document(
+            args.input_file,
+            args.output_dir,
+            raw=args.raw,
+            parts=args.parts,
+            workers=args.workers,
+        )
+    except (ValueError, zipfile.BadZipFile) as e:
+        raise SystemExit(f"Error: {e}")
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, raw=False, parts=None, workers=None):
+    """Extract an Office file, pretty-printing its XML parts.
+
+    Each part is parsed straight from the zip and written once, already
+    formatted, so that get_node(line_number=...) matches the Read tool.
+    Parts are formatted largest first, in worker processes when there are
+    many of them; everything else (media, unselected parts) is streamed to
+    disk unchanged.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to unpack into (created if needed)
+        raw: If True, format nothing and keep all bytes as-is
+        parts: Optional glob patterns of the parts to format, e.g.
+            ["word/document.xml", "word/comments*.xml"]; default: all
+            *.xml and *.rels parts
+        workers: Number of formatting processes (default: CPU count for
+            files with many XML parts, otherwise 1). Ignored inside
+            daemonic processes such as multiprocessing.Pool workers
+
+    Returns:
+        list: Names of the parts that were pretty-printed
+
+    Raises:
+        ValueError: If a member would be written outside output_dir
+    """
+    output_path = Path(output_dir).resolve()
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    formatted = []
+    with zipfile.ZipFile(input_file) as zf:
+        for info in zf.infolist():
+            target = _member_path(output_path, info.filename)
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if not raw and _should_format(info.filename, parts):
+                formatted.append(info)
+                continue
+            with zf.open(info) as source, open(target, "wb") as f:
+                shutil.copyfileobj(source, f)
+
+    # Largest parts first so one big document.xml does not finish last
+    formatted.sort(key=lambda info: info.file_size, reverse=True)
+    tasks = [
+        (info.filename, _member_path(output_path, info.filename)) for info in formatted
+    ]
+    processes = _pool_size(workers, len(tasks))
+    if processes > 1:
+        with multiprocessing.Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(str(input_file),),
+        ) as pool:
+            for _ in pool.imap_unordered(_format_part, tasks):
+                pass
+    elif tasks:
+        _init_worker(str(input_file))
+        try:
+            for task in tasks:
+                _format_part(task)
+        finally:
+            _close_worker()
+
+    return [name for name, _ in tasks]
+
+
+def _pool_size(workers, task_count):
+    """Return the number of formatting processes to start (1: run serially).
+
+    Daemonic processes, such as Document.map workers, cannot have children
+    and always run serially.
+    """
+    if multiprocessing.current_process().daemon:
+        return 1
+    if workers is None:
+        if task_count < _PARALLEL_MIN_PARTS:
+            return 1
+        workers = multiprocessing.cpu_count()
+    return max(1, min(workers, task_count))
+
+
+def _should_format(name, parts):
+    """Check whether a zip member is selected for pretty-printing."""
+    if not (name.endswith(".xml") or name.endswith(".rels")):
+        return False
+    return parts is None or any(fnmatch.fnmatchcase(name, p) for p in parts)
+
+
+def _member_path(output_path, name):
+    """Resolve a zip member name inside output_path, rejecting path traversal."""
+    target = (output_path / name).resolve()
+    if target != output_path and output_path not in target.parents:
+        raise ValueError(f"Unsafe member path in archive: {name}")
+    return target
+
+
+def _init_worker(input_file):
+    global _worker_zip
+    _worker_zip = zipfile.ZipFile(input_file)
+
+
+def _close_worker():
+    global _worker_zip
+    _worker_zip.close()
+    _worker_zip = None
+
+
+def _format_part(task):
+    """Parse one member from the worker's zip and write it pretty-printed."""
+    name, target = task
+    with _worker_zip.open(name) as source:
+        dom = defusedxml.minidom.parse(source)
+    Path(target).write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+    return name
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ from pathlib import Path
 
 import lxml.etree
 
+# Compiled XSD schemas by path, shared by all validators in the process
+_SCHEMA_CACHE = {}
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,7 +106,20 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(self, unpacked_dir, original_file, verbose=False, changed_files=None):
+        """
+        Args:
+            unpacked_dir: Unpacked document directory to validate
+            original_file: Original document, for comparing XSD errors
+            verbose: Print passing checks too
+            changed_files: Optional paths (relative to unpacked_dir) of the parts
+                changed since the last successful validation. Per-part checks
+                (well-formedness, namespaces, unique IDs, XSD, relationship IDs,
+                content type roots) then only look at these parts and the parts
+                whose .rels changed; package-wide reference checks still run,
+                and global IDs are still compared with every part.
+                Default: check every part.
+        """
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
@@ -120,6 +136,22 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parts the per-part checks look at
+        if changed_files is None:
+            self.changed_files = None
+            self.changed_xml_files = self.xml_files
+        else:
+            self.changed_files = {
+                (self.unpacked_dir / path).resolve() for path in changed_files
+            }
+            self.changed_xml_files = [
+                f for f in self.xml_files if f.resolve() in self.changed_files
+            ]
+
+    def is_changed(self, path):
+        """Return True if per-part checks should look at path (see changed_files)."""
+        return self.changed_files is None or Path(path).resolve() in self.changed_files
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
@@ -128,7 +160,7 @@ class BaseSchemaValidator:
         """Validate that all XML files are well-formed."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.changed_xml_files:
             try:
                 # Try to parse the XML file
                 lxml.etree.parse(str(xml_file))
@@ -157,7 +189,7 @@ class BaseSchemaValidator:
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.changed_xml_files:
             try:
                 root = lxml.etree.parse(str(xml_file)).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
@@ -188,81 +220,24 @@ class BaseSchemaValidator:
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
+        if self.changed_files is not None:
+            # Changed parts must not reuse a global ID of an unchanged part;
+            # duplicates among unchanged parts were reported when they changed
+            global_tags = [
+                tag.encode()
+                for tag, (_, scope) in self.UNIQUE_ID_REQUIREMENTS.items()
+                if scope == "global"
+            ]
+            changed = set(self.changed_xml_files)
+            for xml_file in self.xml_files:
+                if xml_file in changed:
+                    continue
+                content = xml_file.read_bytes().lower()
+                if any(tag in content for tag in global_tags):
+                    self._check_unique_ids(xml_file, global_ids, [], file_scope=False)
 
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        for xml_file in self.changed_xml_files:
+            self._check_unique_ids(xml_file, global_ids, errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,6 +249,82 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _check_unique_ids(self, xml_file, global_ids, errors, file_scope=True):
+        """Check one part's IDs, recording global ones in global_ids.
+
+        File-scope IDs are only checked if file_scope is True.
+        """
+        file_ids = {}  # Track IDs that must be unique within this file
+        try:
+            root = lxml.etree.parse(str(xml_file)).getroot()
+
+            # Remove all mc:AlternateContent elements from the tree
+            mc_elements = root.xpath(
+                ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+            )
+            for elem in mc_elements:
+                elem.getparent().remove(elem)
+
+            # Now check IDs in the cleaned tree
+            for elem in root.iter():
+                # Get the element name without namespace
+                tag = (
+                    elem.tag.split("}")[-1].lower()
+                    if "}" in elem.tag
+                    else elem.tag.lower()
+                )
+
+                # Check if this element type has ID uniqueness requirements
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+                    if scope == "file" and not file_scope:
+                        continue
+
+                    # Look for the specified attribute
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = (
+                            attr.split("}")[-1].lower() if "}" in attr else attr.lower()
+                        )
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            # Check global uniqueness
+                            if id_value in global_ids:
+                                prev_file, prev_line, prev_tag = global_ids[id_value]
+                                errors.append(
+                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                    f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
+                                    f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                                )
+                            else:
+                                global_ids[id_value] = (
+                                    xml_file.relative_to(self.unpacked_dir),
+                                    elem.sourceline,
+                                    tag,
+                                )
+                        elif scope == "file":
+                            # Check file-level uniqueness
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                errors.append(
+                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                    f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                    f"(first occurrence at line {prev_line})"
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}")
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -409,6 +460,10 @@ class BaseSchemaValidator:
             if not rels_file.exists():
                 continue
 
+            # Only parts that changed or whose relationships changed
+            if not self.is_changed(xml_file) and not self.is_changed(rels_file):
+                continue
+
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
                 rels_root = lxml.etree.parse(str(rels_file)).getroot()
@@ -580,7 +635,13 @@ class BaseSchemaValidator:
             all_files = [f for f in all_files if f.is_file()]
 
             # Check all XML files for Override declarations
-            for xml_file in self.xml_files:
+            # Every part's declaration is affected when [Content_Types].xml changed
+            xml_files = (
+                self.xml_files
+                if self.is_changed(content_types_file)
+                else self.changed_xml_files
+            )
+            for xml_file in xml_files:
                 path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
                     "\\", "/"
                 )
@@ -692,7 +753,7 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for xml_file in self.changed_xml_files:
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
             is_valid, new_file_errors = self.validate_file_against_xsd(
                 xml_file, verbose=False
@@ -719,7 +780,7 @@ class BaseSchemaValidator:
 
         # Print summary
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(self.changed_xml_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
@@ -823,20 +884,34 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
-        schema_path = self._get_schema_path(xml_file)
-        if not schema_path:
-            return None, None  # Skip file
+    @classmethod
+    def _load_schema(cls, schema_path):
+        """Return the compiled XSD schema for a path, compiling it on first use.
 
-        try:
-            # Load schema
+        Compiled schemas are shared by all validators in the process, so
+        validating many documents (or a file and its original) compiles each
+        schema only once.
+        """
+        schema = _SCHEMA_CACHE.get(schema_path)
+        if schema is None:
             with open(schema_path, "rb") as xsd_file:
                 parser = lxml.etree.XMLParser()
                 xsd_doc = lxml.etree.parse(
                     xsd_file, parser=parser, base_url=str(schema_path)
                 )
                 schema = lxml.etree.XMLSchema(xsd_doc)
+            _SCHEMA_CACHE[schema_path] = schema
+        return schema
+
+    def _validate_single_file_xsd(self, xml_file, base_path):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+        schema_path = self._get_schema_path(xml_file)
+        if not schema_path:
+            return None, None  # Skip file
+
+        try:
+            # Load schema (compiled once per process)
+            schema = self._load_schema(schema_path)
 
             # Load and preprocess XML
             with open(xml_file, "r") as f:
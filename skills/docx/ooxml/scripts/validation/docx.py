@@ -64,8 +64,9 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         if not self.validate_all_relationship_ids():
             all_valid = False
 
-        # Count and compare paragraphs
-        self.compare_paragraph_counts()
+        # Count and compare paragraphs (unchanged if document.xml is)
+        if any(f.name == "document.xml" for f in self.changed_xml_files):
+            self.compare_paragraph_counts()
 
         return all_valid
 
@@ -75,7 +76,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.changed_xml_files:
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
@@ -128,7 +129,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.changed_xml_files:
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
@@ -220,7 +221,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.changed_xml_files:
             if xml_file.name != "document.xml":
                 continue
 
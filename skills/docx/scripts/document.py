@@ -24,40 +24,62 @@ Usage:
 
     # Save
     doc.save()
+
+    # Edit a .docx directly (no unpack/pack round trip)
+    doc = Document.open_docx('input.docx')
+    doc.save_docx('output.docx')
+
+    # Use the lxml engine instead of minidom (same API, faster on large files)
+    doc = Document('workspace/unpacked', engine="lxml")
 """
 
 import html
+import multiprocessing
+import os
 import random
+import re
 import shutil
 import tempfile
+import time
+import zipfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, NamedTuple, Optional
 
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.pack import condense_xml_bytes, copy_member_raw, member_compression
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Namespaces declared on demand for injected attributes
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+W16DU_NAMESPACE = "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+W16CEX_NAMESPACE = "http://schemas.microsoft.com/office/word/2018/wordml/cex"
 
-class DocxXMLEditor(XMLEditor):
-    """XMLEditor that automatically applies RSID, author, and date to new elements.
 
-    Automatically adds attributes to elements that support them when inserting new content:
-    - w:rsidR, w:rsidRDefault, w:rsidP (for w:p and w:r elements)
-    - w:author and w:date (for w:ins, w:del, w:comment elements)
-    - w:id (for w:ins and w:del elements)
+class _DocxEditorMixin:
+    """Attribute injection and tracked-change methods shared by both engines.
 
-    Attributes:
-        dom (defusedxml.minidom.Document): The DOM document for direct manipulation
+    Written against the minidom-style node API that XMLEditor and
+    LxmlXMLEditor nodes both provide. Subclasses supply the few primitives
+    that depend on how the engine stores text and names: _rename_element,
+    _move_children, _own_text and the _ensure_*_namespace methods.
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        change_ids: Optional["ChangeIdAllocator"] = None,
+        hex_ids: Optional["HexIdAllocator"] = None,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,54 +88,59 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            change_ids: Allocator shared with the other parts of the document
+                (default: a new allocator seeded from this file only)
+            hex_ids: paraId/textId allocator shared with the other parts of the
+                document (default: a new allocator seeded from this file only)
         """
         super().__init__(xml_path)
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self.change_ids = change_ids or ChangeIdAllocator([self.xml_path])
+        self.hex_ids = hex_ids or HexIdAllocator([self.xml_path])
+        # Nodes awaiting attribute injection while batch() is open
+        self._batch_depth = 0
+        self._pending_injection = []
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next unused tracked change ID."""
+        return self.change_ids.allocate()
 
-    def _ensure_w16du_namespace(self):
-        """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+    @contextmanager
+    def batch(self):
+        """Defer attribute injection for many edits to a single pass.
 
-    def _ensure_w16cex_namespace(self):
-        """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        Inside the block, replace_node/insert_*/append_to and the tracked-change
+        helpers modify the DOM immediately and return their nodes as usual, but
+        RSID/author/date/ID injection is queued. On exit, all queued nodes are
+        processed in one traversal with change IDs taken from a running counter
+        instead of rescanning the document for every w:ins/w:del. Batches nest;
+        injection runs when the outermost block exits.
 
-    def _ensure_w14_namespace(self):
-        """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        Example:
+            editor = doc["word/document.xml"]
+            with editor.batch():
+                for run in runs:
+                    editor.suggest_deletion(run)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                pending, self._pending_injection = self._pending_injection, []
+                self._apply_attributes(pending)
 
     def _inject_attributes_to_nodes(self, nodes):
+        """Inject attributes now, or queue the nodes while a batch() is open."""
+        if self._batch_depth:
+            self._pending_injection.extend(nodes)
+        else:
+            self._apply_attributes(nodes)
+
+    def _apply_attributes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
 
         Adds attributes to elements that support them:
@@ -125,16 +152,14 @@ class DocxXMLEditor(XMLEditor):
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
         Args:
-            nodes: List of DOM nodes to process
+            nodes: List of elements to process
         """
-        from datetime import datetime, timezone
-
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
             parent = elem.parentNode
-            while parent:
+            while parent is not None:
                 if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
                     return True
                 parent = parent.parentNode
@@ -150,24 +175,32 @@ class DocxXMLEditor(XMLEditor):
             # Add w14:paraId and w14:textId if not present
             if not elem.hasAttribute("w14:paraId"):
                 self._ensure_w14_namespace()
-                elem.setAttribute("w14:paraId", _generate_hex_id())
+                elem.setAttribute("w14:paraId", self.hex_ids.allocate())
+            else:
+                self.hex_ids.observe(elem.getAttribute("w14:paraId"))
             if not elem.hasAttribute("w14:textId"):
                 self._ensure_w14_namespace()
-                elem.setAttribute("w14:textId", _generate_hex_id())
+                elem.setAttribute("w14:textId", self.hex_ids.allocate())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, inside_deletion):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if inside_deletion:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
                 if not elem.hasAttribute("w:rsidR"):
                     elem.setAttribute("w:rsidR", self.rsid)
 
+        # Tracked changes without w:id; numbered after explicit IDs are observed
+        unnumbered = []
+
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
-            if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+            change_id = elem.getAttribute("w:id")
+            if change_id:
+                self.change_ids.observe(change_id)
+            else:
+                unnumbered.append(elem)
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -195,47 +228,42 @@ class DocxXMLEditor(XMLEditor):
 
         def add_xml_space_to_t(elem):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
-
+            text = self._own_text(elem)
+            if text and (text[0].isspace() or text[-1].isspace()):
+                if not elem.hasAttribute("xml:space"):
+                    elem.setAttribute("xml:space", "preserve")
+
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
         for node in nodes:
             if node.nodeType != node.ELEMENT_NODE:
                 continue
-
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+            # Single top-down pass in document order, carrying whether each
+            # element sits inside a w:del (ancestors are walked once per node)
+            stack = [(node, is_inside_deletion(node))]
+            while stack:
+                elem, inside_deletion = stack.pop()
+                tag = elem.tagName
+                if tag == "w:r":
+                    add_rsid_to_r(elem, inside_deletion)
+                elif tag in handlers:
+                    handlers[tag](elem)
+                elif ChangeIdAllocator.TAG_PATTERN.fullmatch(tag):
+                    # e.g. w:rPrChange: keep explicit IDs out of later allocations
+                    self.change_ids.observe(elem.getAttribute("w:id"))
+                inside_deletion = inside_deletion or tag == "w:del"
+                stack.extend(
+                    (child, inside_deletion)
+                    for child in reversed(self._element_children(elem))
+                )
+        for elem in unnumbered:
+            elem.setAttribute("w:id", str(self._get_next_change_id()))
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -249,6 +277,12 @@ class DocxXMLEditor(XMLEditor):
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    def insert_nodes_after(self, elem, nodes):
+        """Insert built nodes after elem with automatic attribute injection."""
+        nodes = super().insert_nodes_after(elem, nodes)
+        self._inject_attributes_to_nodes(nodes)
+        return nodes
+
     def insert_before(self, elem, xml_content):
         """Insert before with automatic attribute injection."""
         nodes = super().insert_before(elem, xml_content)
@@ -301,43 +335,31 @@ class DocxXMLEditor(XMLEditor):
 
         # Process all insertions - wrap all children in w:del
         for ins_elem in ins_elements:
-            runs = list(ins_elem.getElementsByTagName("w:r"))
-            if not runs:
-                continue
+            self._reject_insertion(ins_elem)
 
-            # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+        return [elem]
 
-            # Process each run
-            for run in runs:
-                # Convert w:t → w:delText and w:rsidR → w:rsidDel
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
-
-                for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Move all children from ins to del wrapper
-            while ins_elem.firstChild:
-                del_wrapper.appendChild(ins_elem.firstChild)
-
-            # Add del wrapper back to ins
-            ins_elem.appendChild(del_wrapper)
+    def _reject_insertion(self, ins_elem):
+        """Wrap the runs of one w:ins in a w:del inside it; returns the wrapper or None."""
+        runs = list(ins_elem.getElementsByTagName("w:r"))
+        if not runs:
+            return None
 
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+        # Convert w:t → w:delText and w:rsidR → w:rsidDel
+        for run in runs:
+            _swap_attribute(run, "w:rsidR", "w:rsidDel", self.rsid)
+            for t_elem in list(run.getElementsByTagName("w:t")):
+                self._rename_element(t_elem, "w:delText")
 
-        return [elem]
+        # Move all children from ins to a deletion wrapper inside it
+        del_wrapper = self.dom.createElement("w:del")
+        self._move_children(ins_elem, del_wrapper)
+        ins_elem.appendChild(del_wrapper)
+        self._nodes_changed([del_wrapper])
+
+        # Inject attributes to the deletion wrapper
+        self._inject_attributes_to_nodes([del_wrapper])
+        return del_wrapper
 
     def revert_deletion(self, elem):
         """Reject a deletion by re-inserting the deleted content.
@@ -385,44 +407,11 @@ class DocxXMLEditor(XMLEditor):
 
         # Process all deletions - create insertions that copy the deleted content
         for del_elem in del_elements:
-            # Clone the deleted runs and convert them to insertions
-            runs = list(del_elem.getElementsByTagName("w:r"))
-            if not runs:
-                continue
-
-            # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
-
-            for run in runs:
-                # Clone the run
-                new_run = run.cloneNode(True)
-
-                # Convert w:delText → w:t
-                for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
-
-                # Update run attributes: w:rsidDel → w:rsidR
-                if new_run.hasAttribute("w:rsidDel"):
-                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
-                    new_run.removeAttribute("w:rsidDel")
-                elif not new_run.hasAttribute("w:rsidR"):
-                    new_run.setAttribute("w:rsidR", self.rsid)
-
-                ins_elem.appendChild(new_run)
-
-            # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            ins_elem = self._restore_deletion(del_elem)
 
             # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
+            if is_single_del and ins_elem:
+                created_insertion = ins_elem
 
         # Return based on input type
         if is_single_del and created_insertion:
@@ -430,6 +419,108 @@ class DocxXMLEditor(XMLEditor):
         else:
             return [elem]
 
+    def _restore_deletion(self, del_elem):
+        """Insert a w:ins copying one w:del's runs right after it; returns it or None."""
+        # Clone the deleted runs and convert them to insertions
+        runs = list(del_elem.getElementsByTagName("w:r"))
+        if not runs:
+            return None
+
+        ins_elem = self.dom.createElement("w:ins")
+        for run in runs:
+            new_run = run.cloneNode(True)
+            # Convert w:delText → w:t and w:rsidDel → w:rsidR
+            for del_text in list(new_run.getElementsByTagName("w:delText")):
+                self._rename_element(del_text, "w:t")
+            _swap_attribute(new_run, "w:rsidDel", "w:rsidR", self.rsid)
+            ins_elem.appendChild(new_run)
+
+        # Attach the built insertion after the deletion (no serialize/re-parse)
+        self.insert_nodes_after(del_elem, [ins_elem])
+        return ins_elem
+
+    def suggest_deletions(self, elems):
+        """Mark many w:r/w:p elements as deleted in a single batch.
+
+        All elements are checked before anything is changed; the edits then
+        share one attribute-injection pass (see batch()).
+
+        Args:
+            elems: Iterable of w:r or w:p elements without existing tracked changes
+
+        Returns:
+            list: suggest_deletion's result for each element, in order
+
+        Raises:
+            ValueError: If any element has existing tracked changes or invalid
+                structure, or is nested inside another of the elements (e.g.,
+                a w:p and one of its runs)
+
+        Example:
+            editor = doc["word/document.xml"]
+            matches = editor.find_runs("DRAFT")
+            editor.suggest_deletions(run for runs in matches for run in runs)
+        """
+        elems = list(dict.fromkeys(elems))
+        _check_not_nested(elems, "suggest_deletions")
+        for elem in elems:
+            self._check_deletable(elem)
+        with self.batch():
+            return [self.suggest_deletion(elem) for elem in elems]
+
+    def revert_insertions(self, elems):
+        """Reject the insertions in many elements in a single batch.
+
+        Like revert_insertion for each element, with one attribute-injection
+        pass for all of them. Insertions reached through several of the given
+        elements are rejected once.
+
+        Args:
+            elems: Iterable of w:ins elements or containers (w:p, w:tbl, ...)
+
+        Returns:
+            list: The w:del wrappers created, one per insertion that has runs
+
+        Raises:
+            ValueError: If an element contains no w:ins elements or is nested
+                inside another of the elements (nothing is changed)
+        """
+        elems = list(dict.fromkeys(elems))
+        _check_not_nested(elems, "revert_insertions")
+        ins_elements = _collect_tracked_changes(elems, "w:ins", "revert_insertions")
+        with self.batch():
+            wrappers = [self._reject_insertion(ins) for ins in ins_elements]
+        return [wrapper for wrapper in wrappers if wrapper is not None]
+
+    def revert_deletions(self, elems):
+        """Reject the deletions in many elements in a single batch.
+
+        Like revert_deletion for each element: every w:del gets a w:ins copy of
+        its runs right after it, built directly in the DOM, with one
+        attribute-injection pass for all of them.
+
+        Args:
+            elems: Iterable of w:del elements or containers (w:p, w:tbl, ...)
+
+        Returns:
+            list: The w:ins elements created
+
+        Raises:
+            ValueError: If an element contains no w:del elements or is nested
+                inside another of the elements (nothing is changed)
+
+        Example:
+            editor = doc["word/document.xml"]
+            body = editor.dom.getElementsByTagName("w:body")[0]
+            editor.revert_deletions([body])  # Restore every deletion
+        """
+        elems = list(dict.fromkeys(elems))
+        _check_not_nested(elems, "revert_deletions")
+        del_elements = _collect_tracked_changes(elems, "w:del", "revert_deletions")
+        with self.batch():
+            insertions = [self._restore_deletion(del_elem) for del_elem in del_elements]
+        return [ins for ins in insertions if ins is not None]
+
     @staticmethod
     def suggest_paragraph(xml_content: str) -> str:
         """Transform paragraph XML to add tracked change wrapping for insertion.
@@ -495,29 +586,13 @@ class DocxXMLEditor(XMLEditor):
         Raises:
             ValueError: If element has existing tracked changes or invalid structure
         """
-        if elem.nodeName == "w:r":
-            # Check for existing w:delText
-            if elem.getElementsByTagName("w:delText"):
-                raise ValueError("w:r element already contains w:delText")
+        self._check_deletable(elem)
 
-            # Convert w:t → w:delText
+        if elem.nodeName == "w:r":
+            # Convert w:t → w:delText and w:rsidR → w:rsidDel
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Update run attributes: w:rsidR → w:rsidDel
-            if elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidDel", elem.getAttribute("w:rsidR"))
-                elem.removeAttribute("w:rsidR")
-            elif not elem.hasAttribute("w:rsidDel"):
-                elem.setAttribute("w:rsidDel", self.rsid)
+                self._rename_element(t_elem, "w:delText")
+            _swap_attribute(elem, "w:rsidR", "w:rsidDel", self.rsid)
 
             # Wrap in w:del
             del_wrapper = self.dom.createElement("w:del")
@@ -525,17 +600,14 @@ class DocxXMLEditor(XMLEditor):
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
             del_wrapper.appendChild(elem)
+            self._nodes_changed([del_wrapper])
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
             return del_wrapper
 
-        elif elem.nodeName == "w:p":
-            # Check for existing tracked changes
-            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
-                raise ValueError("w:p element already contains tracked changes")
-
+        else:
             # Check if it's a numbered list item
             pPr_list = elem.getElementsByTagName("w:pPr")
             is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
@@ -553,60 +625,486 @@ class DocxXMLEditor(XMLEditor):
 
                 # Add <w:del/> marker
                 del_marker = self.dom.createElement("w:del")
-                rPr.insertBefore(
-                    del_marker, rPr.firstChild
-                ) if rPr.firstChild else rPr.appendChild(del_marker)
+                rPr.insertBefore(del_marker, rPr.firstChild)
 
-            # Convert w:t → w:delText in all runs
+            # Convert w:t → w:delText and w:rsidR → w:rsidDel in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Update run attributes: w:rsidR → w:rsidDel
+                self._rename_element(t_elem, "w:delText")
             for run in elem.getElementsByTagName("w:r"):
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
+                _swap_attribute(run, "w:rsidR", "w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
             del_wrapper = self.dom.createElement("w:del")
-            for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
-                elem.removeChild(child)
-                del_wrapper.appendChild(child)
+            self._move_children(elem, del_wrapper, keep="w:pPr")
             elem.appendChild(del_wrapper)
+            self._nodes_changed([elem])
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
             return elem
 
+    @staticmethod
+    def _check_deletable(elem):
+        """Raise ValueError unless elem is a w:r or w:p that suggest_deletion accepts."""
+        if elem.nodeName == "w:r":
+            # Check for existing w:delText
+            if elem.getElementsByTagName("w:delText"):
+                raise ValueError("w:r element already contains w:delText")
+        elif elem.nodeName == "w:p":
+            # Check for existing tracked changes
+            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
+                raise ValueError("w:p element already contains tracked changes")
         else:
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
-def _generate_hex_id() -> str:
-    """Generate random 8-character hex ID for para/durable IDs.
+class DocxXMLEditor(_DocxEditorMixin, XMLEditor):
+    """XMLEditor that automatically applies RSID, author, and date to new elements.
+
+    Automatically adds attributes to elements that support them when inserting new content:
+    - w:rsidR, w:rsidRDefault, w:rsidP (for w:p and w:r elements)
+    - w:author and w:date (for w:ins, w:del, w:comment elements)
+    - w:id (for w:ins and w:del elements)
+
+    Attributes:
+        dom (defusedxml.minidom.Document): The DOM document for direct manipulation
+    """
+
+    def _ensure_w16du_namespace(self):
+        """Ensure w16du namespace is declared on the root element."""
+        root = self.dom.documentElement
+        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
+            root.setAttribute(  # type: ignore
+                "xmlns:w16du",
+                W16DU_NAMESPACE,
+            )
+
+    def _ensure_w16cex_namespace(self):
+        """Ensure w16cex namespace is declared on the root element."""
+        root = self.dom.documentElement
+        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
+            root.setAttribute(  # type: ignore
+                "xmlns:w16cex",
+                W16CEX_NAMESPACE,
+            )
+
+    def _ensure_w14_namespace(self):
+        """Ensure w14 namespace is declared on the root element."""
+        root = self.dom.documentElement
+        if not root.hasAttribute("xmlns:w14"):  # type: ignore
+            root.setAttribute(  # type: ignore
+                "xmlns:w14",
+                W14_NAMESPACE,
+            )
+
+    def _rename_element(self, elem, tag):
+        """Replace elem with a copy named tag (e.g., w:t → w:delText); returns the copy."""
+        renamed = self.dom.createElement(tag)
+        # Copy ALL child nodes (not just firstChild) to handle entities
+        while elem.firstChild:
+            renamed.appendChild(elem.firstChild)
+        # Preserve attributes like xml:space
+        for i in range(elem.attributes.length):
+            attr = elem.attributes.item(i)
+            renamed.setAttribute(attr.name, attr.value)
+        elem.parentNode.replaceChild(renamed, elem)
+        return renamed
+
+    @staticmethod
+    def _move_children(source, target, keep=None):
+        """Move the child nodes of source, except keep elements, to the end of target."""
+        for child in [c for c in source.childNodes if c.nodeName != keep]:
+            source.removeChild(child)
+            target.appendChild(child)
+
+    @staticmethod
+    def _own_text(elem):
+        """Return the text of elem's first child text node ("" if none)."""
+        child = elem.firstChild
+        if child is not None and child.nodeType == child.TEXT_NODE:
+            return child.data
+        return ""
+
+
+class LxmlDocxXMLEditor(_DocxEditorMixin, LxmlXMLEditor):
+    """DocxXMLEditor counterpart built on the lxml engine.
+
+    Applies the same RSID, author, date and ID injection as DocxXMLEditor and
+    offers the same tracked-change methods (suggest_deletion, revert_insertion,
+    revert_deletion, suggest_paragraph). Elements are lxml elements with
+    minidom-style accessors; see LxmlXMLEditor.
+
+    Attributes:
+        tree (lxml.etree._ElementTree): The parsed tree for direct manipulation
+    """
+
+    def _ensure_w16du_namespace(self):
+        """Ensure w16du namespace is declared on the root element."""
+        self._ensure_namespace("w16du", W16DU_NAMESPACE)
+
+    def _ensure_w16cex_namespace(self):
+        """Ensure w16cex namespace is declared on the root element."""
+        self._ensure_namespace("w16cex", W16CEX_NAMESPACE)
+
+    def _ensure_w14_namespace(self):
+        """Ensure w14 namespace is declared on the root element."""
+        self._ensure_namespace("w14", W14_NAMESPACE)
+
+    def _rename_element(self, elem, tag):
+        """Rename elem in place (e.g., w:t → w:delText); returns elem."""
+        prefix, local = tag.split(":", 1)
+        elem.tag = f"{{{self.tree.getroot().nsmap[prefix]}}}{local}"
+        return elem
+
+    @staticmethod
+    def _move_children(source, target, keep=None):
+        """Move the children of source, except keep elements, to the end of target.
+
+        Text before the first child moves with it, and each child keeps its tail.
+        """
+        moved = [
+            child
+            for child in source
+            if not (isinstance(child.tag, str) and child.tagName == keep)
+        ]
+        if moved and source[0] is moved[0]:
+            target.text, source.text = source.text, None
+        for child in moved:
+            target.append(child)
+
+    @staticmethod
+    def _own_text(elem):
+        """Return the text before elem's first child ("" if none)."""
+        return elem.text or ""
+
+
+class ChangeIdAllocator:
+    """Hands out unique w:id values for tracked changes (w:ins, w:del, ...).
+
+    Seeded once from the highest ID found in the given XML parts, then
+    allocates in O(1). IDs are never reused, so removing tracked changes
+    cannot cause collisions. Explicit IDs on inserted content are reported via
+    observe() by the editors' attribute injection; call it yourself after adding
+    tracked changes with explicit IDs through direct DOM manipulation.
+
+    Example:
+        change_ids = ChangeIdAllocator.for_package(Path("unpacked"))
+        change_ids.allocate()  # -> highest existing ID + 1
+    """
+
+    # Change annotations sharing the ID space, e.g. <w:ins w:id="3" ...>,
+    # <w:rPrChange w:id="4" ...>, <w:moveFromRangeStart w:id="5" ...>
+    TAG_PATTERN = re.compile(
+        r"w:(?:ins|del|cellIns|cellDel|cellMerge|\w+Change"
+        r"|(?:moveFrom|moveTo)(?:Range(?:Start|End))?|customXml\w+Range(?:Start|End))"
+    )
+    ID_PATTERN = re.compile(
+        b"<" + TAG_PATTERN.pattern.encode() + rb"\b[^>]*?\sw:id=\"(\d+)\""
+    )
+
+    def __init__(self, xml_paths=()):
+        """
+        Args:
+            xml_paths: XML files to scan for existing IDs (missing files are skipped)
+        """
+        self._next_id = 0
+        for path in xml_paths:
+            path = Path(path)
+            if path.exists():
+                for match in self.ID_PATTERN.finditer(path.read_bytes()):
+                    self._next_id = max(self._next_id, int(match.group(1)) + 1)
+
+    @classmethod
+    def for_package(cls, unpacked_path):
+        """Seed from every part that can hold tracked changes in an unpacked DOCX.
+
+        Covers document.xml, footnotes, endnotes, comments, headers and footers.
+        """
+        word_path = Path(unpacked_path) / "word"
+        paths = [
+            word_path / name
+            for name in (
+                "document.xml",
+                "footnotes.xml",
+                "endnotes.xml",
+                "comments.xml",
+            )
+        ]
+        paths += sorted(word_path.glob("header*.xml"))
+        paths += sorted(word_path.glob("footer*.xml"))
+        return cls(paths)
+
+    def allocate(self) -> int:
+        """Return an unused ID and mark it as used."""
+        change_id = self._next_id
+        self._next_id += 1
+        return change_id
+
+    def observe(self, change_id):
+        """Record an ID already present in the document (int or digit string)."""
+        try:
+            self._next_id = max(self._next_id, int(change_id) + 1)
+        except ValueError:
+            pass
+
+
+class HexIdAllocator:
+    """Hands out unique 8-digit hex IDs (w14:paraId, w14:textId, durableId) and RSIDs.
+
+    Seeded once with every paraId, textId and durableId found in the given XML
+    parts, then allocates random values not in that set, so new IDs never
+    collide with existing ones. Pass a seed for reproducible IDs across runs.
 
     Values are constrained to be less than 0x7FFFFFFF per OOXML spec:
     - paraId must be < 0x80000000
     - durableId must be < 0x7FFFFFFF
     We use the stricter constraint (0x7FFFFFFF) for both.
+
+    Example:
+        hex_ids = HexIdAllocator.for_package(Path("unpacked"), seed=42)
+        hex_ids.allocate()  # -> e.g. "1C2A9F3B", unused in the package
+    """
+
+    # e.g. w14:paraId="1C2A9F3B", w16cid:durableId="6D0B1A2C"
+    ID_PATTERN = re.compile(rb":(?:paraId|textId|durableId)=\"([0-9A-Fa-f]{8})\"")
+
+    def __init__(self, xml_paths=(), seed=None):
+        """
+        Args:
+            xml_paths: XML files to scan for existing IDs (missing files are skipped)
+            seed: Optional seed for reproducible IDs and RSIDs (default: random)
+        """
+        self._random = random.Random(seed)
+        self._used = set()
+        for path in xml_paths:
+            path = Path(path)
+            if path.exists():
+                for match in self.ID_PATTERN.finditer(path.read_bytes()):
+                    self._used.add(match.group(1).decode().upper())
+
+    @classmethod
+    def for_package(cls, unpacked_path, seed=None):
+        """Seed from every XML part under word/ in an unpacked DOCX."""
+        return cls(sorted((Path(unpacked_path) / "word").glob("*.xml")), seed=seed)
+
+    def allocate(self) -> str:
+        """Return an unused hex ID and mark it as used."""
+        while True:
+            hex_id = f"{self._random.randint(1, 0x7FFFFFFE):08X}"
+            if hex_id not in self._used:
+                self._used.add(hex_id)
+                return hex_id
+
+    def observe(self, hex_id):
+        """Record an ID already present in the document."""
+        self._used.add(hex_id.upper())
+
+    def rsid(self) -> str:
+        """Generate random 8-character hex RSID."""
+        return "".join(self._random.choices("0123456789ABCDEF", k=8))
+
+
+def _collect_tracked_changes(elems, tag, method):
+    """Gather w:ins/w:del elements from elements or containers, once each, in order.
+
+    Raises:
+        ValueError: If one of the elements contains no matching elements
+    """
+    found = {}
+    kind = "insertions" if tag == "w:ins" else "deletions"
+    for elem in elems:
+        changes = [elem] if elem.tagName == tag else elem.getElementsByTagName(tag)
+        if not changes:
+            raise ValueError(
+                f"{method} requires {tag} elements. "
+                f"The provided element <{elem.tagName}> contains no {kind}. "
+            )
+        found.update(dict.fromkeys(changes))
+    return list(found)
+
+
+def _check_not_nested(elems, method):
+    """Raise ValueError if one of elems is inside another, before anything is changed.
+
+    Batch methods edit the elements one after another, so an element whose
+    ancestor was edited first could fail halfway through the batch.
     """
-    return f"{random.randint(1, 0x7FFFFFFE):08X}"
+    given = set(elems)
+    for elem in elems:
+        parent = elem.parentNode
+        while parent is not None:
+            if parent in given:
+                raise ValueError(
+                    f"{method} got <{elem.tagName}> together with its enclosing "
+                    f"<{parent.tagName}>. Pass only one of them."
+                )
+            parent = parent.parentNode
+
+
+def _swap_attribute(elem, old_name, new_name, default):
+    """Move an attribute to a new name (e.g., w:rsidR -> w:rsidDel), or set a default."""
+    if elem.hasAttribute(old_name):
+        elem.setAttribute(new_name, elem.getAttribute(old_name))
+        elem.removeAttribute(old_name)
+    elif not elem.hasAttribute(new_name):
+        elem.setAttribute(new_name, default)
+
 
+def _link_or_copy(src, dst):
+    """Hard-link src to dst, copying instead where links are unsupported (e.g., across devices)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
 
-def _generate_rsid() -> str:
-    """Generate random 8-character hex RSID."""
-    return "".join(random.choices("0123456789ABCDEF", k=8))
+
+def _ignore_non_xml(directory, names):
+    """copytree ignore callback keeping only directories and XML parts (*.xml, *.rels)."""
+    return [
+        name
+        for name in names
+        if not name.endswith((".xml", ".rels"))
+        and not os.path.isdir(os.path.join(directory, name))
+    ]
+
+
+def _replace_file(src, dst):
+    """Put src at dst by linking (or copying) it to a temporary name and renaming.
+
+    Skips files that are already the same file as dst (unchanged since the
+    workspace was created or last saved), and never writes into dst's inode,
+    so baseline links keep the original content. Workspace files are only ever
+    replaced, never rewritten, so linking them into the destination is safe.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    dst_dir, dst_name = os.path.split(dst)
+    fd, temp_name = tempfile.mkstemp(dir=dst_dir, prefix=f".{dst_name}.")
+    os.close(fd)
+    try:
+        os.unlink(temp_name)
+        _link_or_copy(src, temp_name)
+        os.replace(temp_name, dst)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+    return dst
+
+
+def _comment_anchor(start_nodes, end_nodes):
+    """Return [w:commentRangeStart, reference run] from inserted anchor nodes."""
+    anchor = [None, None]
+    for node in start_nodes:
+        if node.nodeType == node.ELEMENT_NODE:
+            anchor[0] = node
+    for node in end_nodes:
+        if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:r":
+            anchor[1] = node
+    return anchor
+
+
+def _init_map_worker(max_memory_mb):
+    """Document.map pool initializer: cap the worker's address space."""
+    if max_memory_mb:
+        import resource
+
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _map_document(task):
+    """Document.map worker: open one document, run fn on it and time it."""
+    document_cls, path, fn, kwargs = task
+    start = time.perf_counter()
+    doc = None
+    try:
+        if path.is_dir():
+            doc = document_cls(path, **kwargs)
+        else:
+            doc = document_cls.open_docx(path, **kwargs)
+        value, error = fn(doc), None
+    except Exception as e:
+        value, error = None, f"{type(e).__name__}: {e}"
+    finally:
+        if doc is not None:
+            doc.close()
+    return DocumentResult(path, value, error, time.perf_counter() - start)
+
+
+class DocumentResult(NamedTuple):
+    """Outcome of one document processed by Document.map."""
+
+    path: Path
+    value: Any  # fn's return value (None if it failed)
+    error: Optional[str]  # "ExceptionType: message" if opening or fn failed
+    seconds: float
+
+
+class WorkspacePool:
+    """Reusable temporary workspace directories for Document.
+
+    Directories are created under a private root on first use and kept when a
+    Document is closed (only their contents are removed), so processing many
+    documents does not create and delete a temp dir per document. The root
+    defaults to the system temp directory. Files from an unpacked directory on
+    another filesystem are copied rather than hard-linked, so keep the root on
+    the same filesystem as the unpacked sources. For .docx inputs
+    (Document.open_docx), root="/dev/shm" keeps workspaces in memory.
+
+    Example:
+        with WorkspacePool() as pool:
+            for path in paths:
+                with Document.open_docx(path, workspace_pool=pool) as doc:
+                    ...
+    """
+
+    def __init__(self, root=None, max_idle=8):
+        """
+        Args:
+            root: Directory to create workspaces in (default: the system
+                temp directory)
+            max_idle: Maximum number of released directories kept for reuse
+        """
+        self.root = Path(tempfile.mkdtemp(prefix="docx_pool_", dir=root))
+        self.max_idle = max_idle
+        self._idle = []
+
+    def acquire(self) -> str:
+        """Return an empty workspace directory."""
+        if self._idle:
+            return self._idle.pop()
+        return tempfile.mkdtemp(prefix="docx_", dir=self.root)
+
+    def release(self, path):
+        """Empty a directory from acquire() and keep it for reuse."""
+        if len(self._idle) >= self.max_idle:
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    os.unlink(entry.path)
+        self._idle.append(str(path))
+
+    def close(self) -> None:
+        """Remove the pool root and every workspace in it."""
+        self._idle.clear()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Editor classes by Document engine name
+EDITOR_ENGINES = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}
 
 
 class Document:
@@ -619,6 +1117,9 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        engine="minidom",
+        seed=None,
+        workspace_pool=None,
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,25 +1131,70 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            engine: XML engine for editors, "minidom" or "lxml" (default: "minidom").
+                Both expose the same editor API; lxml loads and searches large parts faster.
+            seed: Optional seed for the generated RSID, paraIds and durableIds, so
+                repeated runs of the same edits produce the same IDs (default: random)
+            workspace_pool: Optional WorkspacePool to take the temporary workspace from
+                (default: a new temp directory per Document)
+
+        Use as a context manager, or call close(), to remove the workspace as
+        soon as the document is no longer needed:
+            with Document('unpacked') as doc:
+                ...
+                doc.save()
         """
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
-
-        # Create temporary directory with subdirectories for unpacked content and baseline
-        self.temp_dir = tempfile.mkdtemp(prefix="docx_")
+        if engine not in EDITOR_ENGINES:
+            raise ValueError(
+                f"Unknown engine: {engine}. Expected one of: {', '.join(EDITOR_ENGINES)}"
+            )
+        self.engine = engine
+
+        # Create temporary directory with subdirectories for unpacked content and baseline.
+        # Files are hard-linked rather than copied (copied only where linking fails);
+        # editors replace files on save, so linked originals are never modified.
+        self._workspace_pool = workspace_pool
+        if workspace_pool is not None:
+            self.temp_dir = workspace_pool.acquire()
+        else:
+            self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        shutil.copytree(
+            self.original_path, self.unpacked_path, copy_function=_link_or_copy
+        )
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Snapshot the original XML parts (links, no media) as the validation
+        # baseline; the baseline .docx is only packed on first validate()
+        self.baseline_path = Path(self.temp_dir) / "baseline"
+        shutil.copytree(
+            self.original_path,
+            self.baseline_path,
+            ignore=_ignore_non_xml,
+            copy_function=_link_or_copy,
+        )
+        self._original_docx = None
+
+        # Stat signatures of the XML parts as last validated (or as loaded);
+        # validate() only re-checks parts whose signature changed
+        self._validated_parts = self._part_signatures()
+
+        # Set by open_docx(): source .docx and its members not yet extracted
+        # (name -> None, or (size, mtime_ns) once extracted for validation)
+        self._source_docx = None
+        self._unextracted = {}
 
         self.word_path = self.unpacked_path / "word"
 
+        # paraIds, textIds and durableIds are unique across all parts, so
+        # editors share one allocator (also used for the RSID)
+        self.hex_ids = HexIdAllocator.for_package(self.unpacked_path, seed=seed)
+
         # Generate RSID if not provided
-        self.rsid = rsid if rsid else _generate_rsid()
+        self.rsid = rsid if rsid else self.hex_ids.rsid()
         print(f"Using RSID: {self.rsid}")
 
         # Set default author and initials
@@ -658,6 +1204,9 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Tracked change IDs are unique across all parts, so editors share one allocator
+        self.change_ids = ChangeIdAllocator.for_package(self.unpacked_path)
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -677,6 +1226,110 @@ class Document:
         # Add author to people.xml
         self._add_author_to_people(author)
 
+    @classmethod
+    def open_docx(cls, docx_path, **kwargs) -> "Document":
+        """
+        Open a .docx file directly, without unpacking it to a directory first.
+
+        Only the XML parts (*.xml, *.rels) are extracted, as-is (not
+        pretty-printed, so line_number lookups are not meaningful). Media and
+        other binary parts stay compressed in the .docx until validate() needs
+        them. Save with save_docx().
+
+        Args:
+            docx_path: Path to the .docx file
+            **kwargs: Passed to Document() (rsid, track_revisions, author, initials,
+                engine, seed, workspace_pool)
+
+        Returns:
+            Document: Document backed by the .docx file
+
+        Example:
+            doc = Document.open_docx("input.docx", author="Claude")
+            doc.add_comment(start=node, end=node, text="Check this")
+            doc.save_docx("output.docx")
+        """
+        docx_path = Path(docx_path)
+        if not zipfile.is_zipfile(docx_path):
+            raise ValueError(f"Not a .docx file: {docx_path}")
+
+        pool = kwargs.get("workspace_pool")
+        source_dir = pool.acquire() if pool else tempfile.mkdtemp(prefix="docx_source_")
+        try:
+            unextracted = {}
+            with zipfile.ZipFile(docx_path) as zf:
+                for info in zf.infolist():
+                    if info.filename.endswith((".xml", ".rels")):
+                        zf.extract(info, source_dir)
+                    elif not info.is_dir():
+                        unextracted[info.filename] = None
+            doc = cls(source_dir, **kwargs)
+        finally:
+            # The workspace and baseline hold their own links to the extracted parts
+            if pool:
+                pool.release(source_dir)
+            else:
+                shutil.rmtree(source_dir)
+
+        doc.original_path = docx_path
+        doc._source_docx = docx_path
+        doc._unextracted = unextracted
+        return doc
+
+    @classmethod
+    def map(
+        cls,
+        paths,
+        fn,
+        workers=None,
+        max_memory_mb=None,
+        tasks_per_worker=None,
+        **kwargs,
+    ):
+        """
+        Run fn on many documents in parallel worker processes.
+
+        Each path is opened in a worker (unpacked directories with Document(),
+        .docx files with open_docx()) and passed to fn, which makes its edits,
+        saves, and returns a picklable value. Results are yielded as each
+        document finishes, not in input order. A failure in one document is
+        reported in its result and does not stop the others. Compiled
+        validation schemas are reused by all documents handled by a worker.
+
+        Args:
+            paths: Unpacked DOCX directories and/or .docx files
+            fn: Module-level function taking a Document (must be picklable)
+            workers: Number of worker processes (default: CPU count)
+            max_memory_mb: Optional address-space limit per worker (Unix only);
+                a document exceeding it fails with MemoryError
+            tasks_per_worker: Optional number of documents after which a
+                worker is replaced, releasing any memory it accumulated
+            **kwargs: Passed to Document() (rsid, track_revisions, author, initials,
+                engine, seed, workspace_pool)
+
+        Yields:
+            DocumentResult(path, value, error, seconds) per document
+
+        Example:
+            def review(doc):
+                doc.add_comment(start=..., end=..., text="Check")
+                doc.save_docx(doc.original_path.with_suffix(".reviewed.docx"))
+                return doc.next_comment_id
+
+            for result in Document.map(paths, review, workers=8, max_memory_mb=2048):
+                print(result.path, result.error or result.value, f"{result.seconds:.2f}s")
+        """
+        tasks = [(cls, Path(path), fn, kwargs) for path in paths]
+        if not tasks:
+            return
+        with multiprocessing.Pool(
+            workers,
+            initializer=_init_map_worker,
+            initargs=(max_memory_mb,),
+            maxtasksperchild=tasks_per_worker,
+        ) as pool:
+            yield from pool.imap_unordered(_map_document, tasks)
+
     def __getitem__(self, xml_path: str) -> DocxXMLEditor:
         """
         Get or create a DocxXMLEditor for the specified XML file.
@@ -704,9 +1357,14 @@ class Document:
             file_path = self.unpacked_path / xml_path
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
-            # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
+            # Use the engine's DocxXMLEditor with RSID, author, and initials for all editors
+            self._editors[xml_path] = EDITOR_ENGINES[self.engine](
+                file_path,
+                rsid=self.rsid,
+                author=self.author,
+                initials=self.initials,
+                change_ids=self.change_ids,
+                hex_ids=self.hex_ids,
             )
         return self._editors[xml_path]
 
@@ -727,40 +1385,7 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
-
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
-
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
-
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
-
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
-
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
-
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
-
-        self.next_comment_id += 1
-        return comment_id
+        return self.add_comments([{"start": start, "end": end, "text": text}])[0]
 
     def reply_to_comment(
         self,
@@ -780,108 +1405,344 @@ class Document:
         Example:
             cm.reply_to_comment(parent_comment_id=0, text="I agree with this change")
         """
-        if parent_comment_id not in self.existing_comments:
-            raise ValueError(f"Parent comment with id={parent_comment_id} not found")
+        return self.add_comments([{"parent": parent_comment_id, "text": text}])[0]
 
-        parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    def add_comments(self, comments) -> list:
+        """
+        Add many comments and replies at once.
 
-        # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
-            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
-        )
-        parent_ref_elem = self._document.get_node(
-            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
-        )
+        Equivalent to calling add_comment/reply_to_comment for each entry in
+        order, but each comment part is updated with a single fragment parse,
+        document.xml anchors are parsed in one pass and get their attributes
+        in one injection pass, and reply anchors are indexed by comment ID so
+        each parent is looked up at most once.
+
+        Args:
+            comments: Iterable of dicts, either {"start": elem, "end": elem,
+                "text": str} for a new comment or {"parent": comment_id,
+                "text": str} for a reply. IDs are assigned in order starting
+                at next_comment_id, so replies may refer to comments added
+                earlier in the same call.
+
+        Returns:
+            List of the comment IDs created, in input order
+
+        Raises:
+            ValueError: If an entry is malformed or a parent comment is not found
+
+        Example:
+            ids = doc.add_comments([
+                {"start": node1, "end": node1, "text": "First"},
+                {"start": node2, "end": node2, "text": "Second"},
+                {"parent": 0, "text": "Reply to an existing comment"},
+            ])
+        """
+        # Allocate IDs and validate all entries before touching any part
+        entries = []
+        existing = dict(self.existing_comments)
+        for offset, comment in enumerate(comments):
+            comment_id = self.next_comment_id + offset
+            parent_id = comment.get("parent")
+            if parent_id is not None:
+                if parent_id not in existing:
+                    raise ValueError(f"Parent comment with id={parent_id} not found")
+                parent_para_id = existing[parent_id]["para_id"]
+            elif "start" in comment and "end" in comment:
+                parent_para_id = None
+            else:
+                raise ValueError(
+                    'Each comment needs "start" and "end" elements or a "parent" ID'
+                )
+            para_id = self.hex_ids.allocate()
+            existing[comment_id] = {"para_id": para_id}
+            entries.append(
+                (comment, comment_id, para_id, self.hex_ids.allocate(), parent_para_id)
+            )
+        if not entries:
+            return []
+
+        self._insert_comment_anchors(entries)
 
-        self._document.insert_after(
-            parent_start_elem, self._comment_range_start_xml(comment_id)
+        # One fragment per comment part, each parsed and injected once
+        self._append_comment_entries(
+            "comments.xml",
+            "w:comments",
+            (
+                self._comment_xml(comment_id, para_id, comment["text"])
+                for comment, comment_id, para_id, _, _ in entries
+            ),
         )
-        parent_ref_run = parent_ref_elem.parentNode
-        self._document.insert_after(
-            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
+        self._append_comment_entries(
+            "commentsExtended.xml",
+            "w15:commentsEx",
+            (
+                self._comment_ex_xml(para_id, parent_para_id)
+                for _, _, para_id, _, parent_para_id in entries
+            ),
         )
-        self._document.insert_after(
-            parent_ref_run, self._comment_ref_run_xml(comment_id)
+        self._append_comment_entries(
+            "commentsIds.xml",
+            "w16cid:commentsIds",
+            (
+                f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+                for _, _, para_id, durable_id, _ in entries
+            ),
         )
-
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
+        self._append_comment_entries(
+            "commentsExtensible.xml",
+            "w16cex:commentsExtensible",
+            (
+                f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+                for _, _, _, durable_id, _ in entries
+            ),
         )
 
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
+        # Update existing_comments so replies work
+        self.existing_comments = existing
+        self.next_comment_id += len(entries)
+        return [comment_id for _, comment_id, _, _, _ in entries]
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+    def close(self) -> None:
+        """
+        Release the editors and remove the temporary workspace.
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Unsaved changes are discarded and the Document cannot be used
+        afterwards. Safe to call more than once; called on exiting a with
+        block, and on garbage collection as a fallback.
+        """
+        temp_dir = getattr(self, "temp_dir", None)
+        if temp_dir is None:
+            return
+        self.temp_dir = None
+        self._editors = {}
+        self._document = None
+        pool = getattr(self, "_workspace_pool", None)
+        if pool is not None:
+            pool.release(temp_dir)
+        else:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+    def __enter__(self):
+        return self
 
-        self.next_comment_id += 1
-        return comment_id
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
-        if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
+        self.close()
+
+    @property
+    def original_docx(self) -> Path:
+        """Baseline .docx of the original XML parts for the validators (packed on first use)."""
+        if self._original_docx is None:
+            original_docx = Path(self.temp_dir) / "original.docx"
+            with zipfile.ZipFile(original_docx, "w", zipfile.ZIP_STORED) as zf:
+                for path in sorted(self.baseline_path.rglob("*")):
+                    if path.is_file():
+                        zf.write(path, path.relative_to(self.baseline_path).as_posix())
+            self._original_docx = original_docx
+        return self._original_docx
 
     def validate(self) -> None:
         """
         Validate the document against XSD schema and redlining rules.
 
+        Incremental: only XML parts changed since the Document was created or
+        last validated successfully (and parts whose .rels changed) are
+        re-checked; package-wide reference and content type checks always run.
+        Does nothing if no part changed.
+
         Raises:
             ValueError: If validation fails.
         """
+        # File reference checks need the media parts in the workspace
+        self._extract_remaining()
+
+        # Only parts changed since loading or the last successful validation
+        # are re-checked; unchanged parts keep their earlier result
+        signatures = self._part_signatures()
+        changed = [
+            name
+            for name, signature in signatures.items()
+            if self._validated_parts.get(name) != signature
+        ]
+        if not changed and signatures.keys() == self._validated_parts.keys():
+            return
+
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path, self.original_docx, verbose=False, changed_files=changed
         )
         redlining_validator = RedliningValidator(
             self.unpacked_path, self.original_docx, verbose=False
         )
 
-        # Run validations
+        # Run validations (redlining only concerns document.xml)
         if not schema_validator.validate():
             raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
+        if "word/document.xml" in changed and not redlining_validator.validate():
             raise ValueError("Redlining validation failed")
 
+        self._validated_parts = signatures
+
     def save(self, destination=None, validate=True) -> None:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Every loaded part whose XML changed is written, including parts edited
+        directly through editor.dom, and only files that differ from the
+        destination are copied, each atomically (temp file + rename).
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
-        # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
-            self._ensure_comment_relationships()
-            self._ensure_comment_content_types()
+        if destination is None and self._source_docx is not None:
+            raise ValueError(
+                "Document was opened from a .docx; use save_docx() or pass a destination"
+            )
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        self._save_editors()
 
         # Validate by default
         if validate:
             self.validate()
 
         # Copy contents from temp directory to destination (or original directory)
+        self._extract_remaining()
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        shutil.copytree(
+            self.unpacked_path,
+            target_path,
+            dirs_exist_ok=True,
+            copy_function=_replace_file,
+        )
+
+    def save_docx(self, docx_path, validate=True) -> None:
+        """
+        Save the document as a .docx file in a single pass.
+
+        Parts that were not modified are copied from the source .docx as raw
+        compressed bytes, without decompressing or recompressing them; modified
+        and new parts are condensed and compressed. The file is written to a
+        temporary name and renamed into place.
+
+        Args:
+            docx_path: Output .docx path (may be the source .docx)
+            validate: If True, validates document before saving (default: True).
+
+        Raises:
+            ValueError: If the Document was not created with open_docx().
+        """
+        if self._source_docx is None:
+            raise ValueError("save_docx() requires a Document created with open_docx()")
+
+        self._save_editors()
+
+        # Validate by default
+        if validate:
+            self.validate()
+
+        output_path = Path(docx_path)
+        fd, temp_name = tempfile.mkstemp(
+            dir=output_path.parent, prefix=f".{output_path.name}."
+        )
+        os.close(fd)
+        try:
+            with (
+                zipfile.ZipFile(self._source_docx) as source,
+                zipfile.ZipFile(temp_name, "w", zipfile.ZIP_DEFLATED) as target,
+            ):
+                written = set()
+                for info in source.infolist():
+                    written.add(info.filename)
+                    path = self.unpacked_path / info.filename
+                    if info.is_dir() or self._is_unchanged(info.filename, path):
+                        copy_member_raw(source, target, info)
+                    elif path.is_file():
+                        self._write_member(
+                            target,
+                            zipfile.ZipInfo(info.filename, date_time=info.date_time),
+                            path,
+                        )
+
+                # Parts created while editing (e.g., comments.xml, people.xml)
+                for path in sorted(self.unpacked_path.rglob("*")):
+                    name = path.relative_to(self.unpacked_path).as_posix()
+                    if path.is_file() and name not in written:
+                        self._write_member(
+                            target, zipfile.ZipInfo.from_file(path, name), path
+                        )
+            os.replace(temp_name, output_path)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+
+    # ==================== Private: Saving ====================
+
+    def _save_editors(self):
+        """Complete comment infrastructure and write the editors with changes."""
+        # Only ensure comment relationships and content types if comment files exist
+        if self.comments_path.exists():
+            self._ensure_comment_relationships()
+            self._ensure_comment_content_types()
+
+        # Save the modified XML files in temp directory; editors that were only
+        # read are not rewritten
+        for editor in self._editors.values():
+            editor.save_if_changed()
+
+    def _extract_remaining(self):
+        """Extract the source .docx members not yet in the workspace (open_docx only)."""
+        pending = [name for name, stat in self._unextracted.items() if stat is None]
+        if not pending:
+            return
+        with zipfile.ZipFile(self._source_docx) as zf:
+            for name in pending:
+                path = self.unpacked_path / name
+                if path.exists():
+                    # Written by the caller; saved as a modified part
+                    continue
+                zf.extract(name, self.unpacked_path)
+                stat = path.stat()
+                self._unextracted[name] = (stat.st_size, stat.st_mtime_ns)
+
+    def _part_signatures(self):
+        """Map each XML part in the workspace to its (inode, size, mtime) signature.
+
+        Editors replace files on save, so a saved part always gets a new inode.
+        """
+        signatures = {}
+        for path in self.unpacked_path.rglob("*"):
+            if path.name.endswith((".xml", ".rels")) and path.is_file():
+                stat = path.stat()
+                name = path.relative_to(self.unpacked_path).as_posix()
+                signatures[name] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        return signatures
+
+    def _is_unchanged(self, name, path):
+        """Check whether a source .docx member is unchanged in the workspace."""
+        if name in self._unextracted:
+            extracted = self._unextracted[name]
+            if not path.exists():
+                return extracted is None
+            stat = path.stat()
+            return extracted == (stat.st_size, stat.st_mtime_ns)
+        # XML parts are unchanged while the workspace file is still the baseline link
+        baseline = self.baseline_path / name
+        return path.exists() and baseline.exists() and os.path.samefile(path, baseline)
+
+    @staticmethod
+    def _write_member(target, info, path):
+        """Compress a workspace file into target, condensing XML parts."""
+        data = path.read_bytes()
+        if path.name.endswith((".xml", ".rels")):
+            data = condense_xml_bytes(data)
+        info.compress_type, level = member_compression(path.name)
+        target.writestr(info, data, compresslevel=level)
 
     # ==================== Private: Initialization ====================
 
@@ -1065,70 +1926,99 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
+    def _insert_comment_anchors(self, entries):
+        """Insert the document.xml ranges and reference runs for add_comments."""
+        document = self._document
 
-        editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
+        # Parse every anchor fragment in one pass: start, end, reply reference run
+        fragments = []
+        for _, comment_id, _, _, parent_para_id in entries:
+            fragments.append(self._comment_range_start_xml(comment_id))
+            if parent_para_id is None:
+                fragments.append(self._comment_range_end_xml(comment_id))
+            else:
+                fragments.append(f'<w:commentRangeEnd w:id="{comment_id}"/>')
+                fragments.append(self._comment_ref_run_xml(comment_id))
+        parsed = iter(document.parse_fragments(fragments))
+
+        # Comment ID -> [w:commentRangeStart, w:commentReference run]; anchors of
+        # parents outside this call are looked up once, before anything is inserted
+        new_ids = {comment_id for _, comment_id, _, _, _ in entries}
+        parent_ids = {
+            comment["parent"]
+            for comment, _, _, _, parent_para_id in entries
+            if parent_para_id is not None and comment["parent"] not in new_ids
+        }
+        anchors = {}
+        for parent_id in sorted(parent_ids):
+            parent_ref = document.get_node(
+                tag="w:commentReference", attrs={"w:id": str(parent_id)}
+            )
+            anchors[parent_id] = [
+                document.get_node(
+                    tag="w:commentRangeStart", attrs={"w:id": str(parent_id)}
+                ),
+                parent_ref.parentNode,
+            ]
+
+        with document.batch():
+            for comment, comment_id, _, _, parent_para_id in entries:
+                start_nodes = next(parsed)
+                if parent_para_id is None:
+                    start, end = comment["start"], comment["end"]
+                    end_nodes = next(parsed)
+                    start_nodes = document.insert_before(start, start_nodes)
+                    # If end node is a paragraph, append comment markup inside it
+                    # Otherwise insert after it (for run-level anchors)
+                    if end.tagName == "w:p":
+                        end_nodes = document.append_to(end, end_nodes)
+                    else:
+                        end_nodes = document.insert_after(end, end_nodes)
+                    anchors[comment_id] = _comment_anchor(start_nodes, end_nodes)
+                    continue
+
+                parent_start, parent_ref_run = anchors[comment["parent"]]
+                end_nodes, ref_nodes = next(parsed), next(parsed)
+                start_nodes = document.insert_after(parent_start, start_nodes)
+                end_nodes = document.insert_after(parent_ref_run, end_nodes)
+                ref_nodes = document.insert_after(parent_ref_run, ref_nodes)
+                anchors[comment_id] = _comment_anchor(
+                    start_nodes, end_nodes + ref_nodes
+                )
+
+    def _append_comment_entries(self, part_name, root_tag, fragments):
+        """Append entries to a comment part, creating it from the template if missing."""
+        path = self.word_path / part_name
+        if not path.exists():
+            shutil.copy(TEMPLATE_DIR / part_name, path)
+
+        editor = self[f"word/{part_name}"]
+        root = editor.get_node(tag=root_tag)
+        editor.append_to(root, "".join(fragments))
 
+    # ==================== Private: XML Fragments ====================
+
+    def _comment_xml(self, comment_id, para_id, text):
+        """Generate XML for a comments.xml entry.
+
+        Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r, and
+        w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor.
+        """
         escaped_text = (
             text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
         )
-        # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
-        # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
+        return f'''<w:comment w:id="{comment_id}">
   <w:p w14:paraId="{para_id}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
     <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
   </w:p>
 </w:comment>'''
-        editor.append_to(root, comment_xml)
-
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
-
-        editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
 
+    def _comment_ex_xml(self, para_id, parent_para_id):
+        """Generate XML for a commentsExtended.xml entry."""
         if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
-
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
-
-        editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
-
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
-
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
-
-        editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
-
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
-
-    # ==================== Private: XML Fragments ====================
+            return f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+        return f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
 
     def _comment_range_start_xml(self, comment_id):
         """Generate XML for comment range start."""
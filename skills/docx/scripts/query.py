@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Read-only streaming queries over unpacked Word XML parts.
+
+Parses with lxml.etree.iterparse and releases each paragraph, table and
+comment once it has been reported, so memory stays flat regardless of file
+size. Use it for inspection jobs (counting revisions, listing comments,
+collecting paragraph IDs); use Document/DocxXMLEditor for editing.
+
+Line numbers are those of the start tags, matching get_node(line_number=...)
+on the same file. Paragraphs and runs also carry their get_path locator, which
+does not depend on formatting (use it with get_node_by_path on files unpacked
+with --raw).
+
+Usage:
+    from collections import Counter
+    from scripts.query import iter_comments, iter_paragraphs, iter_revisions
+
+    # Tracked changes per author
+    counts = Counter(
+        (rev.author, rev.kind) for rev in iter_revisions("unpacked/word/document.xml")
+    )
+
+    # Paragraph IDs, locators and text
+    for para in iter_paragraphs("unpacked/word/document.xml"):
+        print(para.line, para.para_id, para.path, para.text)
+
+    # Comments
+    for comment in iter_comments("unpacked/word/comments.xml"):
+        print(comment.id, comment.author, comment.text)
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+import lxml.etree
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+
+
+def _w(local):
+    return f"{{{W_NAMESPACE}}}{local}"
+
+
+_P, _R, _T, _DEL_TEXT = _w("p"), _w("r"), _w("t"), _w("delText")
+_P_STYLE, _COMMENT, _TBL = _w("pStyle"), _w("comment"), _w("tbl")
+_REVISION_KINDS = {_w("ins"): "ins", _w("del"): "del"}
+_PARA_ID = f"{{{W14_NAMESPACE}}}paraId"
+
+# Elements released from memory once they have been reported
+_RELEASED = {_P, _TBL, _COMMENT}
+
+
+class Paragraph(NamedTuple):
+    """A w:p element. text is the current text (w:t only, deletions excluded).
+
+    path is the element's get_path locator (usable with get_node_by_path).
+    """
+
+    line: int
+    para_id: str | None
+    style: str | None
+    text: str
+    path: str
+
+
+class Run(NamedTuple):
+    """A w:r element. revision is "ins" or "del" if the run is inside one.
+
+    path is the element's get_path locator (usable with get_node_by_path).
+    """
+
+    line: int
+    paragraph_line: int | None
+    text: str
+    revision: str | None
+    path: str
+
+
+class Revision(NamedTuple):
+    """A w:ins or w:del element (including empty paragraph-mark markers)."""
+
+    kind: str
+    line: int
+    id: str | None
+    author: str | None
+    date: str | None
+    text: str
+
+
+class Comment(NamedTuple):
+    """A w:comment element from comments.xml."""
+
+    line: int
+    id: str | None
+    author: str | None
+    date: str | None
+    initials: str | None
+    text: str
+
+
+def iter_paragraphs(xml_path) -> Iterator[Paragraph]:
+    """Yield every paragraph in document order (nested ones before their container)."""
+    return (item for item in _stream(xml_path) if type(item) is Paragraph)
+
+
+def iter_runs(xml_path) -> Iterator[Run]:
+    """Yield every run in document order."""
+    return (item for item in _stream(xml_path) if type(item) is Run)
+
+
+def iter_revisions(xml_path) -> Iterator[Revision]:
+    """Yield every w:ins and w:del in document order of their end tags."""
+    return (item for item in _stream(xml_path) if type(item) is Revision)
+
+
+def iter_comments(xml_path) -> Iterator[Comment]:
+    """Yield every comment in comments.xml with its plain text."""
+    return (item for item in _stream(xml_path) if type(item) is Comment)
+
+
+def _stream(xml_path):
+    """Yield Paragraph, Run, Revision and Comment records as their end tags are read."""
+    xml_path = Path(xml_path)
+    if not xml_path.exists():
+        raise ValueError(f"XML file not found: {xml_path}")
+
+    # Open elements of interest, innermost last; text is gathered into the
+    # parts lists as w:t/w:delText elements end
+    paragraphs: list[list] = []  # [line, para_id, style, parts, path]
+    runs: list[list] = []  # [line, paragraph_line, parts, revision, path]
+    revisions: list[list] = []  # [kind, line, id, author, date, parts]
+    comments: list[list] = []  # [line, id, author, date, initials, parts]
+
+    # get_path locator steps of the open elements; a paragraph with a paraId
+    # replaces the steps so far with its "#paraId" anchor
+    steps: list[str] = []
+    anchors: list[int] = [0]  # index in steps where the current locator starts
+    positions: list[dict] = [{}]  # per open element: child name -> count so far
+    names = {}  # Clark tag -> "prefix:name"
+
+    context = lxml.etree.iterparse(
+        str(xml_path),
+        events=("start", "end"),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    )
+    for event, elem in context:
+        tag = elem.tag
+        if event == "start":
+            name = names.get(tag)
+            if name is None:
+                local = lxml.etree.QName(tag).localname
+                name = names[tag] = f"{elem.prefix}:{local}" if elem.prefix else local
+            counts = positions[-1]
+            counts[name] = counts.get(name, 0) + 1
+            positions.append({})
+            para_id = elem.get(_PARA_ID) if tag == _P else None
+            if para_id:
+                steps.append(f"#{para_id}")
+                anchors.append(len(steps) - 1)
+            else:
+                steps.append(f"/{name}[{counts[name]}]")
+                anchors.append(anchors[-1])
+
+            if tag == _P:
+                path = "".join(steps[anchors[-1] :])
+                paragraphs.append([elem.sourceline, para_id, None, [], path])
+            elif tag == _R:
+                paragraph_line = paragraphs[-1][0] if paragraphs else None
+                revision = revisions[-1][0] if revisions else None
+                path = "".join(steps[anchors[-1] :])
+                runs.append([elem.sourceline, paragraph_line, [], revision, path])
+            elif tag in _REVISION_KINDS:
+                revisions.append(
+                    [
+                        _REVISION_KINDS[tag],
+                        elem.sourceline,
+                        elem.get(_w("id")),
+                        elem.get(_w("author")),
+                        elem.get(_w("date")),
+                        [],
+                    ]
+                )
+            elif tag == _P_STYLE and paragraphs:
+                paragraphs[-1][2] = elem.get(_w("val"))
+            elif tag == _COMMENT:
+                comments.append(
+                    [
+                        elem.sourceline,
+                        elem.get(_w("id")),
+                        elem.get(_w("author")),
+                        elem.get(_w("date")),
+                        elem.get(_w("initials")),
+                        [],
+                    ]
+                )
+            continue
+
+        steps.pop()
+        anchors.pop()
+        positions.pop()
+
+        if tag == _T or tag == _DEL_TEXT:
+            text = elem.text or ""
+            if runs:
+                runs[-1][2].append(text)
+            if revisions:
+                revisions[-1][5].append(text)
+            if tag == _T:
+                if paragraphs:
+                    paragraphs[-1][3].append(text)
+                if comments:
+                    comments[-1][5].append(text)
+        elif tag == _R:
+            line, paragraph_line, parts, revision, path = runs.pop()
+            yield Run(line, paragraph_line, "".join(parts), revision, path)
+        elif tag in _REVISION_KINDS:
+            kind, line, change_id, author, date, parts = revisions.pop()
+            yield Revision(kind, line, change_id, author, date, "".join(parts))
+        elif tag == _P:
+            line, para_id, style, parts, path = paragraphs.pop()
+            yield Paragraph(line, para_id, style, "".join(parts), path)
+            if comments:
+                # Separate the paragraphs of a multi-paragraph comment
+                comments[-1][5].append("\n")
+        elif tag == _COMMENT:
+            line, comment_id, author, date, initials, parts = comments.pop()
+            text = "".join(parts).rstrip("\n")
+            yield Comment(line, comment_id, author, date, initials, text)
+
+        if tag in _RELEASED:
+            _release(elem)
+
+
+def _release(elem):
+    """Free a fully processed element and the already processed siblings before it."""
+    elem.clear(keep_tail=True)
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
@@ -22,20 +22,49 @@ Example usage:
     # Combine filters
     elem = editor.get_node(tag="w:p", line_number=range(1, 50), contains="text")
 
+    # Find every match, including text split across runs
+    paras = editor.find_nodes(tag="w:p", contains="text")
+    run_groups = editor.find_runs("text split across runs")
+
+    # Attribute, line and text lookups are served from indexes built on first use.
+    # The indexes follow edits made with the DOM methods of editor.dom nodes
+    # (setAttribute, appendChild, text.data = ...); see invalidate_index() for
+    # other edits.
+
     # Replace, insert, or manipulate
     new_elem = editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
     editor.insert_after(new_elem, "<w:r><w:t>more</w:t></w:r>")
 
     # Save changes
     editor.save()
+
+LxmlXMLEditor offers the same API on top of lxml, which parses faster, uses less
+memory and records line numbers natively. Its elements support the minidom
+accessors used with XMLEditor (tagName, getAttribute, setAttribute, parentNode,
+getElementsByTagName, toxml); text lives in lxml's .text/.tail instead of child
+text nodes.
+
+    editor = LxmlXMLEditor("document.xml")
+    elem = editor.get_node(tag="w:r", line_number=519)
 """
 
+import bisect
+import copy
+import hashlib
 import html
+import os
+import re
+import stat
+import tempfile
 from pathlib import Path
 from typing import Optional, Union
+from xml.dom import minidom
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
 
 class XMLEditor:
@@ -50,6 +79,7 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        dirty: True once the DOM has been modified and not yet saved
     """
 
     def __init__(self, xml_path):
@@ -72,6 +102,17 @@ class XMLEditor:
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        # Record direct edits from now on (parsing itself is not recorded)
+        self.dom._changes = _DomChanges()
+
+        # Lookup indexes for get_node/find_nodes, built lazily on first use
+        self._index = None
+        self._text_index = None
+        # Root namespace declarations for fragment wrappers, as (key, string)
+        self._ns_declarations = None
+        # Set by edits (including direct DOM edits, see _apply_dom_changes),
+        # cleared by save()
+        self.dirty = False
 
     def get_node(
         self,
@@ -109,40 +150,7 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        matches = self.find_nodes(tag, attrs, line_number, contains)
 
         if not matches:
             # Build descriptive error message
@@ -180,6 +188,280 @@ class XMLEditor:
             )
         return matches[0]
 
+    def find_nodes(
+        self,
+        tag: str,
+        attrs: Optional[dict[str, str]] = None,
+        line_number: Optional[Union[int, range]] = None,
+        contains: Optional[str] = None,
+    ):
+        """
+        Find all DOM elements matching the given filters.
+
+        Accepts the same filters as get_node but returns every match instead of
+        requiring exactly one.
+
+        Args:
+            tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
+            attrs: Dictionary of attribute name-value pairs to match (e.g., {"w:id": "1"})
+            line_number: Line number (int) or line range (range) in original XML file (1-indexed)
+            contains: Text string that must appear in any text node within the element.
+                      Supports both entity notation (&#8220;) and Unicode characters (\u201c).
+
+        Returns:
+            List[defusedxml.minidom.Element]: Matching elements in document order (may be empty)
+
+        Example:
+            paras = editor.find_nodes(tag="w:p", contains="Agreement")
+            runs = editor.find_nodes(tag="w:r", line_number=range(100, 200), contains="fee")
+        """
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and "“Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        candidates = self._get_candidates(tag, attrs, line_number, normalized_contains)
+        matches = self._filter_nodes(
+            candidates, attrs, line_number, normalized_contains
+        )
+
+        # Nodes inserted after the index was built are appended out of order
+        if attrs and len(matches) > 1:
+            matches.sort(key=_document_position)
+        return matches
+
+    def _filter_nodes(self, candidates, attrs, line_number, contains):
+        """Return the candidates that pass every find_nodes filter."""
+        if contains is not None:
+            text_of = self._get_text_index().text_of
+        matches = []
+        for elem in candidates:
+            # Check line_number filter
+            if line_number is not None:
+                parse_pos = getattr(elem, "parse_position", (None,))
+                elem_line = parse_pos[0]
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    elem.getAttribute(attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter
+            if contains is not None:
+                elem_text = text_of(elem)
+                if contains not in elem_text:
+                    continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+        return matches
+
+    def find_runs(self, contains: str):
+        """
+        Find every occurrence of text in w:p elements, including text split across runs.
+
+        Args:
+            contains: Text to search for. Supports both entity notation (&#8220;)
+                      and Unicode characters (\u201c).
+
+        Returns:
+            List[List[defusedxml.minidom.Element]]: One list of w:r elements per
+            occurrence, in document order. Each list holds the consecutive runs
+            that together contain the occurrence.
+
+        Example:
+            for runs in editor.find_runs("Effective Date"):
+                print(len(runs), "run(s)")
+        """
+        text = html.unescape(contains)
+        return self._get_text_index().find_runs(text)
+
+    def get_path(self, elem) -> str:
+        """
+        Return a locator for an element that does not depend on line numbers.
+
+        Each step is "prefix:name[n]", n being the 1-based position among
+        sibling elements with the same name. The path starts at the nearest
+        enclosing (or the element's own) w:p with a w14:paraId, written
+        "#<paraId>", or else at the root ("/"). Locators are unaffected by
+        pretty-printing or condensing, so they also work on files unpacked
+        with --raw; paraId-anchored ones also survive edits outside their
+        paragraph.
+
+        Args:
+            elem: Element in this document
+
+        Returns:
+            str: Locator for get_node_by_path, e.g. "#1A2B3C4D/w:r[2]" or
+                "/w:document[1]/w:body[1]/w:tbl[1]"
+
+        Example:
+            path = editor.get_path(run)
+            run = editor.get_node_by_path(path)  # e.g., after saving and reloading
+        """
+        steps = []
+        node = elem
+        while True:
+            if node.tagName == "w:p" and node.getAttribute("w14:paraId"):
+                steps.append(f"#{node.getAttribute('w14:paraId')}")
+                break
+            parent = node.parentNode
+            if parent is None or parent.nodeType != parent.ELEMENT_NODE:
+                steps.append(f"/{node.tagName}[1]")
+                break
+            position = 1
+            for sibling in self._element_children(parent):
+                if sibling is node:
+                    break
+                if sibling.tagName == node.tagName:
+                    position += 1
+            steps.append(f"/{node.tagName}[{position}]")
+            node = parent
+        return "".join(reversed(steps))
+
+    def get_node_by_path(self, path: str):
+        """
+        Get the element a locator from get_path points to.
+
+        Args:
+            path: Locator, "#<paraId>/step/..." or "/root[1]/step/..."
+
+        Returns:
+            The element at path
+
+        Raises:
+            ValueError: If the path is malformed or no element is at it
+
+        Example:
+            run = editor.get_node_by_path("#1A2B3C4D/w:r[2]")
+            tbl = editor.get_node_by_path("/w:document[1]/w:body[1]/w:tbl[1]")
+        """
+        if path.startswith("#"):
+            para_id, _, rest = path[1:].partition("/")
+            node = self.get_node(tag="w:p", attrs={"w14:paraId": para_id})
+        elif path.startswith("/"):
+            root_step, _, rest = path[1:].partition("/")
+            node = self.dom.documentElement
+            if _parse_path_step(path, root_step) != (node.tagName, 1):  # type: ignore
+                raise ValueError(f"Node not found: {path}. Root is <{node.tagName}>.")  # type: ignore
+        else:
+            raise ValueError(
+                f"Invalid path: {path}. Expected '#<paraId>/...' or '/...'."
+            )
+
+        for step in rest.split("/") if rest else ():
+            tag, position = _parse_path_step(path, step)
+            matches = [c for c in self._element_children(node) if c.tagName == tag]
+            if position > len(matches):
+                raise ValueError(
+                    f"Node not found: {path}. No {step} "
+                    f"(<{node.tagName}> has {len(matches)} <{tag}> children)."
+                )
+            node = matches[position - 1]
+        return node
+
+    def _element_children(self, elem):
+        """Return the child elements of elem, in document order."""
+        return [
+            child for child in elem.childNodes if child.nodeType == child.ELEMENT_NODE
+        ]
+
+    def invalidate_index(self):
+        """
+        Discard the lookup indexes used by get_node and find_nodes.
+
+        The indexes follow edits made through the editor methods and through
+        the DOM methods of editor.dom nodes (setAttribute, removeAttribute,
+        appendChild, insertBefore, replaceChild, removeChild) and text node
+        data assignments, so this is only needed after changing nodes another
+        way, e.g. assigning an Attr's value or a node's tagName. It also marks
+        the editor dirty (see mark_dirty).
+        """
+        self._index = None
+        self._text_index = None
+        self.dirty = True
+
+    def mark_dirty(self):
+        """
+        Mark the file as modified so Document.save writes it without comparing.
+
+        Edits through the editor methods, the DOM methods of editor.dom nodes
+        and invalidate_index set this automatically; call it after changing
+        nodes another way (see invalidate_index).
+        """
+        self.dirty = True
+
+    def _get_candidates(self, tag, attrs, line_number, contains=None):
+        """
+        Return the elements that find_nodes should filter for a query.
+
+        Attribute queries use the attribute index, line queries use the line
+        index, and text queries on w:p/w:r use the text index; anything else
+        falls back to a full scan by tag. Candidates may still need filtering,
+        so find_nodes re-checks every condition.
+        """
+        if attrs:
+            attr_name, attr_value = next(iter(attrs.items()))
+            # An empty value also matches elements without the attribute
+            if attr_value != "":
+                return self._get_index().by_attribute(tag, attr_name, attr_value)
+        if line_number is not None:
+            return self._get_index().by_line(tag, line_number)
+        if contains is not None and tag in ("w:p", "w:r"):
+            return self._get_text_index().containing(tag, contains)
+        return self.dom.getElementsByTagName(tag)
+
+    def _get_index(self):
+        """Return the lookup index, creating it on first use."""
+        self._apply_dom_changes()
+        if self._index is None:
+            self._index = _NodeIndex(self.dom)
+        return self._index
+
+    def _get_text_index(self):
+        """Return the paragraph text index, creating it on first use."""
+        self._apply_dom_changes()
+        if self._text_index is None:
+            self._text_index = _TextIndex(self.dom, self._get_element_text)
+        return self._text_index
+
+    def _nodes_changed(self, nodes):
+        """
+        Record nodes that were inserted or modified so lookups stay current.
+
+        Args:
+            nodes: Roots of the inserted or modified subtrees
+        """
+        self.dirty = True
+        if self._index is not None:
+            self._index.add(nodes)
+        if self._text_index is not None:
+            self._text_index.invalidate(nodes)
+
+    def _apply_dom_changes(self):
+        """Bring the indexes up to date with edits made directly on editor.dom."""
+        changes = self.dom._changes
+        if not changes:
+            return
+        attributes, inserted, text = changes.drain()
+        self.dirty = True
+        if self._index is not None:
+            self._index.add(inserted)
+            self._index.add_elements(attributes)
+        if self._text_index is not None:
+            self._text_index.invalidate(inserted)
+            self._text_index.invalidate_ancestors(text)
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -209,7 +491,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to replace
-            new_content: String containing XML to replace the node with
+            new_content: String containing XML to replace the node with, or a list of
+                nodes (see parse_fragments)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -218,10 +501,11 @@ class XMLEditor:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
         parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
+        nodes = self._prepare_nodes(new_content)
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self._nodes_changed(nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -230,7 +514,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to insert after
-            xml_content: String containing XML to insert
+            xml_content: String containing XML to insert, or a list of nodes
+                (see parse_fragments)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -240,12 +525,42 @@ class XMLEditor:
         """
         parent = elem.parentNode
         next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
+        nodes = self._prepare_nodes(xml_content)
         for node in nodes:
             if next_sibling:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._nodes_changed(nodes)
+        return nodes
+
+    def insert_nodes_after(self, elem, nodes):
+        """
+        Insert already-built DOM nodes after a DOM element, without copying them.
+
+        Unlike insert_after with a node list (which inserts copies), the given
+        nodes themselves are attached, moving them if they are already in the
+        tree. Use it for nodes built with dom.createElement or cloneNode, or
+        taken from parse_fragments, to avoid a serialize/re-parse round trip.
+
+        Args:
+            elem: defusedxml.minidom.Element to insert after
+            nodes: List of defusedxml.minidom.Node objects owned by this document
+
+        Returns:
+            List[defusedxml.minidom.Node]: The inserted nodes
+
+        Example:
+            ins = editor.dom.createElement("w:ins")
+            ins.appendChild(run.cloneNode(True))
+            editor.insert_nodes_after(del_elem, [ins])
+        """
+        nodes = list(nodes)
+        parent = elem.parentNode
+        next_sibling = elem.nextSibling
+        for node in nodes:
+            parent.insertBefore(node, next_sibling)
+        self._nodes_changed(nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -254,7 +569,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to insert before
-            xml_content: String containing XML to insert
+            xml_content: String containing XML to insert, or a list of nodes
+                (see parse_fragments)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -263,9 +579,10 @@ class XMLEditor:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
         parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
+        nodes = self._prepare_nodes(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._nodes_changed(nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -274,7 +591,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to append to
-            xml_content: String containing XML to append
+            xml_content: String containing XML to append, or a list of nodes
+                (see parse_fragments)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -282,9 +600,10 @@ class XMLEditor:
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        nodes = self._parse_fragment(xml_content)
+        nodes = self._prepare_nodes(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._nodes_changed(nodes)
         return nodes
 
     def get_next_rid(self):
@@ -304,10 +623,102 @@ class XMLEditor:
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). The file is replaced
+        atomically (temp file + rename), so hard links to the old file keep
+        their content.
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        self._write(self._serialize())
+
+    def save_if_changed(self) -> bool:
+        """
+        Save the edited XML only if it changed since it was loaded or saved.
+
+        Edits made directly on the DOM with its DOM methods mark the editor
+        dirty like editor methods do, so clean editors are skipped without
+        serializing them.
+
+        Returns:
+            bool: True if the file was written
+        """
+        self._apply_dom_changes()
+        if not self.dirty:
+            return False
+        self.save()
+        return True
+
+    def _write(self, content):
+        _write_atomic(self.xml_path, content)
+        # Direct edits made before the write are saved with it
+        self._apply_dom_changes()
+        self.dirty = False
+
+    def _serialize(self):
+        """Return the DOM as bytes in the file's encoding."""
+        return self.dom.toxml(encoding=self.encoding)
+
+    def parse_fragments(self, fragments):
+        """
+        Parse several XML fragments in a single pass.
+
+        The returned node lists can be passed to replace_node, insert_after,
+        insert_before and append_to in place of XML strings. Each call inserts
+        a fresh copy, so a parsed list can be reused as a template without
+        reparsing (attributes injected into one copy never leak into another).
+
+        Args:
+            fragments: Iterable of strings containing XML fragments
+
+        Returns:
+            List[List[defusedxml.minidom.Node]]: Imported nodes for each fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+
+        Example:
+            run, para = editor.parse_fragments([
+                "<w:r><w:t>text</w:t></w:r>",
+                "<w:p><w:r><w:t>new</w:t></w:r></w:p>",
+            ])
+            for elem in targets:
+                editor.insert_after(elem, run)  # inserts a copy each time
+        """
+        body = "".join(f"<fragment>{fragment}</fragment>" for fragment in fragments)
+        wrapper = f"<root {self._get_namespace_declarations()}>{body}</root>"
+        fragment_doc = defusedxml.minidom.parseString(wrapper)
+        results = []
+        for container in fragment_doc.documentElement.childNodes:  # type: ignore
+            nodes = [
+                self.dom.importNode(child, deep=True) for child in container.childNodes
+            ]
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            results.append(nodes)
+        return results
+
+    def _prepare_nodes(self, content):
+        """Parse an XML string, or copy a template node list, for insertion."""
+        if isinstance(content, str):
+            return self._parse_fragment(content)
+        return [self.dom.importNode(node, deep=True) for node in content]
+
+    def _get_namespace_declarations(self):
+        """
+        Return the root element's xmlns declarations as an attribute string.
+
+        Cached until the root attribute count changes (namespaces are only
+        ever added to the root, never rewritten).
+        """
+        root_elem = self.dom.documentElement
+        attributes = root_elem.attributes if root_elem else None
+        key = attributes.length if attributes else 0
+        if self._ns_declarations is None or self._ns_declarations[0] != key:
+            namespaces = []
+            for i in range(key):
+                attr = attributes.item(i)  # type: ignore
+                if attr.name.startswith("xmlns"):  # type: ignore
+                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+            self._ns_declarations = (key, " ".join(namespaces))
+        return self._ns_declarations[1]
 
     def _parse_fragment(self, xml_content):
         """
@@ -322,17 +733,7 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        wrapper = f"<root {self._get_namespace_declarations()}>{xml_content}</root>"
         fragment_doc = defusedxml.minidom.parseString(wrapper)
         nodes = [
             self.dom.importNode(child, deep=True)
@@ -343,6 +744,1088 @@ class XMLEditor:
         return nodes
 
 
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml instead of minidom.
+
+    Provides the same public API as XMLEditor. Elements are lxml elements that
+    also answer the minidom accessors (tagName, getAttribute, setAttribute,
+    hasAttribute, removeAttribute, parentNode, firstChild, childNodes,
+    appendChild, insertBefore, removeChild, replaceChild, cloneNode,
+    getElementsByTagName, toxml) and dom.createElement creates them, so most
+    code written against XMLEditor runs unchanged. Text is stored in lxml's
+    .text/.tail rather than in child text nodes, and insert/replace methods
+    return inserted elements only (no whitespace text nodes).
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree._ElementTree
+        dom: Minidom-style view of the tree (documentElement, getElementsByTagName)
+        dirty: True once the tree has been modified and not yet saved
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        data = self.xml_path.read_bytes()
+        header = data[:200].decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+
+        root = lxml.etree.fromstring(
+            data, _create_lxml_parser(), base_url=str(self.xml_path)
+        )
+        self.tree = root.getroottree()
+        self.dom = _LxmlDocument(self.tree)
+        # Reused for fragments; root namespace declarations cached for wrappers
+        self._fragment_parser = _create_lxml_parser()
+        self._ns_declarations = None
+        # Set by edits, cleared by save(); save_if_changed() also writes clean
+        # editors whose tree no longer matches the file's digest (lxml has no
+        # hooks for direct edits)
+        self.dirty = False
+        self._saved_digest = _digest(data)
+
+    def find_nodes(
+        self,
+        tag: str,
+        attrs: Optional[dict[str, str]] = None,
+        line_number: Optional[Union[int, range]] = None,
+        contains: Optional[str] = None,
+    ):
+        """
+        Find all elements matching the given filters.
+
+        See XMLEditor.find_nodes. Candidate elements are found with lxml's
+        C-level iteration; text filters are pre-screened with XPath string()
+        before extracting text the way XMLEditor does.
+
+        Returns:
+            List[lxml.etree._Element]: Matching elements in document order (may be empty)
+        """
+        root = self.tree.getroot()
+        clark = _clark_name(tag, root.nsmap)
+        if clark is None:
+            return []
+        normalized_contains = html.unescape(contains) if contains is not None else None
+        squeezed_contains = (
+            "".join(normalized_contains.split()) if normalized_contains else None
+        )
+
+        # Resolve attribute names once, like the tag; names with a prefix not
+        # declared on the root fall back to per-element lookup
+        attr_items = None
+        if attrs is not None:
+            attr_items = [
+                (_attribute_key(attr_name, root.nsmap), attr_name, attr_value)
+                for attr_name, attr_value in attrs.items()
+            ]
+
+        matches = []
+        for elem in root.iter(clark):
+            # Check line_number filter
+            if line_number is not None:
+                if isinstance(line_number, range):
+                    if elem.sourceline not in line_number:
+                        continue
+                elif elem.sourceline != line_number:
+                    continue
+
+            # Check attrs filter
+            if attr_items is not None:
+                if not all(
+                    (elem.get(key, "") if key else elem.getAttribute(attr_name))
+                    == attr_value
+                    for key, attr_name, attr_value in attr_items
+                ):
+                    continue
+
+            # Check contains filter; whitespace-free XPath text is a cheap superset test
+            if normalized_contains is not None:
+                if squeezed_contains and squeezed_contains not in "".join(
+                    _XPATH_STRING(elem).split()
+                ):
+                    continue
+                if normalized_contains not in self._get_element_text(elem):
+                    continue
+
+            matches.append(elem)
+        return matches
+
+    def find_runs(self, contains: str):
+        """
+        Find every occurrence of text in w:p elements, including text split across runs.
+
+        See XMLEditor.find_runs.
+
+        Returns:
+            List[List[lxml.etree._Element]]: One list of w:r elements per occurrence
+        """
+        text = html.unescape(contains)
+        root = self.tree.getroot()
+        p_tag = _clark_name("w:p", root.nsmap)
+        if not text or p_tag is None:
+            return []
+        squeezed = "".join(text.split())
+
+        occurrences = []
+        for para in root.iter(p_tag):
+            if squeezed and squeezed not in "".join(_XPATH_STRING(para).split()):
+                continue
+            parts, runs = [], []
+            _collect_lxml_text(para, parts, runs, [0], own=True)
+            para_text = "".join(parts)
+            start = para_text.find(text)
+            while start != -1:
+                end = start + len(text)
+                covering = [
+                    run
+                    for run_start, run_end, run in runs
+                    if run_start < end and run_end > start
+                ]
+                if covering:
+                    occurrences.append(covering)
+                start = para_text.find(text, end)
+        return occurrences
+
+    def _element_children(self, elem):
+        """Return the child elements of elem, in document order."""
+        return list(elem.iterchildren(lxml.etree.Element))
+
+    def invalidate_index(self):
+        """Mark the editor dirty; lxml lookups scan the tree directly and need no index."""
+        self.dirty = True
+
+    def _nodes_changed(self, nodes):
+        """Mark the editor dirty; lxml lookups scan the tree directly and need no index."""
+        self.dirty = True
+
+    def _apply_dom_changes(self):
+        """Do nothing; lxml trees do not record direct edits (see save_if_changed)."""
+
+    def _get_element_text(self, elem):
+        """
+        Extract text content from an element, skipping whitespace-only text.
+
+        Mirrors XMLEditor._get_element_text for lxml's .text/.tail model.
+
+        Args:
+            elem: lxml element to extract text from
+
+        Returns:
+            str: Concatenated text from all non-whitespace text nodes within the element
+        """
+        parts = []
+        _collect_lxml_text(elem, parts, [], [0], own=False)
+        return "".join(parts)
+
+    def replace_node(self, elem, new_content):
+        """
+        Replace an element with new XML content.
+
+        Args:
+            elem: lxml element to replace
+            new_content: String containing XML to replace the node with, or a list of
+                nodes (see parse_fragments)
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        nodes = self._prepare_nodes(new_content)
+        for node in nodes:
+            elem.addprevious(node)
+        _remove_preserving_tail(elem)
+        self._nodes_changed(nodes)
+        return nodes
+
+    def insert_after(self, elem, xml_content):
+        """
+        Insert XML content after an element.
+
+        Args:
+            elem: lxml element to insert after
+            xml_content: String containing XML to insert, or a list of nodes
+                (see parse_fragments)
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        nodes = self._prepare_nodes(xml_content)
+        anchor = elem
+        for node in nodes:
+            anchor.addnext(node)
+            anchor = node
+        self._nodes_changed(nodes)
+        return nodes
+
+    def insert_nodes_after(self, elem, nodes):
+        """
+        Insert already-built elements after an element, without copying them.
+
+        See XMLEditor.insert_nodes_after.
+
+        Args:
+            elem: lxml element to insert after
+            nodes: List of lxml elements
+
+        Returns:
+            List[lxml.etree._Element]: The inserted elements
+        """
+        nodes = list(nodes)
+        anchor = elem
+        for node in nodes:
+            anchor.addnext(node)
+            anchor = node
+        self._nodes_changed(nodes)
+        return nodes
+
+    def insert_before(self, elem, xml_content):
+        """
+        Insert XML content before an element.
+
+        Args:
+            elem: lxml element to insert before
+            xml_content: String containing XML to insert, or a list of nodes
+                (see parse_fragments)
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        nodes = self._prepare_nodes(xml_content)
+        for node in nodes:
+            elem.addprevious(node)
+        self._nodes_changed(nodes)
+        return nodes
+
+    def append_to(self, elem, xml_content):
+        """
+        Append XML content as a child of an element.
+
+        Args:
+            elem: lxml element to append to
+            xml_content: String containing XML to append, or a list of nodes
+                (see parse_fragments)
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        nodes = self._prepare_nodes(xml_content)
+        for node in nodes:
+            elem.append(node)
+        self._nodes_changed(nodes)
+        return nodes
+
+    def save_if_changed(self) -> bool:
+        """
+        Save the edited XML only if it changed since it was loaded or saved.
+
+        Editors marked dirty are always written. Other editors are serialized
+        and compared with the file's content at load (or the last save), so
+        edits made directly on the tree are saved without calling mark_dirty().
+
+        Returns:
+            bool: True if the file was written
+        """
+        content = self._serialize()
+        if not self.dirty and _digest(content) == self._saved_digest:
+            return False
+        self._write(content)
+        return True
+
+    def _write(self, content):
+        super()._write(content)
+        self._saved_digest = _digest(content)
+
+    def _serialize(self):
+        """Return the tree as bytes in the file's encoding."""
+        return lxml.etree.tostring(
+            self.tree,
+            xml_declaration=True,
+            encoding=self.encoding,
+            standalone=self.tree.docinfo.standalone,
+        )
+
+    def parse_fragments(self, fragments):
+        """
+        Parse several XML fragments in a single pass.
+
+        See XMLEditor.parse_fragments.
+
+        Args:
+            fragments: Iterable of strings containing XML fragments
+
+        Returns:
+            List[List[lxml.etree._Element]]: Top-level elements for each fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        body = "".join(f"<fragment>{fragment}</fragment>" for fragment in fragments)
+        wrapper = self._parse_wrapped(body)
+        results = []
+        for container in wrapper:
+            nodes = [child for child in container if isinstance(child.tag, str)]
+            assert nodes, "Fragment must contain at least one element"
+            results.append(nodes)
+        return results
+
+    def _prepare_nodes(self, content):
+        """Parse an XML string, or copy a template element list, for insertion."""
+        if isinstance(content, str):
+            return self._parse_fragment(content)
+        nodes = []
+        for node in content:
+            node = copy.deepcopy(node)
+            node.tail = None
+            for elem in node.iter():
+                elem.sourceline = 0
+            nodes.append(node)
+        return nodes
+
+    def _get_namespace_declarations(self):
+        """Return the root element's namespaces as an xmlns attribute string (cached)."""
+        if self._ns_declarations is None:
+            nsmap = self.tree.getroot().nsmap
+            self._ns_declarations = " ".join(
+                f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+                for prefix, uri in nsmap.items()
+            )
+        return self._ns_declarations
+
+    def _ensure_namespace(self, prefix, uri):
+        """
+        Declare a namespace prefix on the root element if it is missing.
+
+        lxml cannot add declarations to an existing element, so a placeholder
+        child declaring the prefix is appended and cleanup_namespaces hoists the
+        declaration to the root before the placeholder is removed.
+        """
+        root = self.tree.getroot()
+        if root.nsmap.get(prefix) == uri:
+            return
+        placeholder = lxml.etree.SubElement(root, f"{{{uri}}}_ns", nsmap={prefix: uri})
+        lxml.etree.cleanup_namespaces(
+            root,
+            top_nsmap={prefix: uri},
+            keep_ns_prefixes=[p for p in root.nsmap if p],
+        )
+        root.remove(placeholder)
+        self._ns_declarations = None
+
+    def _parse_wrapped(self, xml_content):
+        """Parse content inside a wrapper declaring the root namespaces; no source lines."""
+        wrapper = lxml.etree.fromstring(
+            f"<root {self._get_namespace_declarations()}>{xml_content}</root>".encode(
+                "utf-8"
+            ),
+            self._fragment_parser,
+        )
+        # Fragment line numbers do not refer to the edited file
+        for elem in wrapper.iter():
+            elem.sourceline = 0
+        return wrapper
+
+    def _parse_fragment(self, xml_content):
+        """
+        Parse XML fragment and return its top-level elements.
+
+        Args:
+            xml_content: String containing XML fragment
+
+        Returns:
+            List of lxml elements without source line numbers
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        wrapper = self._parse_wrapped(xml_content)
+        nodes = [child for child in wrapper if isinstance(child.tag, str)]
+        assert nodes, "Fragment must contain at least one element"
+        return nodes
+
+
+class _LxmlElement(lxml.etree.ElementBase):
+    """lxml element with the minidom accessors used by XMLEditor callers."""
+
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    nodeType = ELEMENT_NODE
+
+    @property
+    def tagName(self):
+        local = lxml.etree.QName(self).localname
+        return f"{self.prefix}:{local}" if self.prefix else local
+
+    @property
+    def nodeName(self):
+        return self.tagName
+
+    @property
+    def parentNode(self):
+        return self.getparent()
+
+    @property
+    def firstChild(self):
+        """First child element (text is held in .text, not in child nodes)."""
+        return self[0] if len(self) else None
+
+    @property
+    def childNodes(self):
+        """Child elements (text is held in .text/.tail, not in child nodes)."""
+        return list(self.iterchildren(lxml.etree.Element))
+
+    def appendChild(self, node):
+        _detach(node)
+        self.append(node)
+        return node
+
+    def insertBefore(self, node, ref):
+        if ref is None:
+            return self.appendChild(node)
+        _detach(node)
+        ref.addprevious(node)
+        return node
+
+    def removeChild(self, node):
+        _detach(node)
+        return node
+
+    def replaceChild(self, node, old):
+        _detach(node)
+        old.addprevious(node)
+        _detach(old)
+        return old
+
+    def cloneNode(self, deep):
+        """Copy of the element without its tail or source line, like minidom's."""
+        if deep:
+            clone = copy.deepcopy(self)
+            clone.tail = None
+        else:
+            clone = self.makeelement(self.tag, self.attrib)
+        for node in clone.iter():
+            node.sourceline = 0
+        return clone
+
+    def getAttribute(self, name):
+        key = _attribute_key(name, self.nsmap)
+        return self.get(key, "") if key else ""
+
+    def hasAttribute(self, name):
+        key = _attribute_key(name, self.nsmap)
+        return key is not None and key in self.attrib
+
+    def setAttribute(self, name, value):
+        key = _attribute_key(name, self.nsmap)
+        if key is None:
+            raise ValueError(f"Undeclared namespace prefix in attribute: {name}")
+        self.set(key, value)
+
+    def removeAttribute(self, name):
+        key = _attribute_key(name, self.nsmap)
+        if key is not None and key in self.attrib:
+            del self.attrib[key]
+
+    def getElementsByTagName(self, name):
+        if name == "*":
+            return list(self.iterdescendants(lxml.etree.Element))
+        clark = _clark_name(name, self.nsmap)
+        return list(self.iterdescendants(clark)) if clark else []
+
+    def toxml(self):
+        return lxml.etree.tostring(self, encoding="unicode", with_tail=False)
+
+
+class _LxmlDocument:
+    """Minidom-style document view over an lxml tree (documentElement, lookups)."""
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    @property
+    def documentElement(self):
+        return self.tree.getroot()
+
+    def createElement(self, name):
+        root = self.tree.getroot()
+        clark = _clark_name(name, root.nsmap)
+        if clark is None:
+            raise ValueError(f"Undeclared namespace prefix in element: {name}")
+        return root.makeelement(clark)
+
+    def getElementsByTagName(self, name):
+        root = self.tree.getroot()
+        if name == "*":
+            return list(root.iter(lxml.etree.Element))
+        clark = _clark_name(name, root.nsmap)
+        return list(root.iter(clark)) if clark else []
+
+    def toxml(self, encoding=None):
+        if encoding is None:
+            return lxml.etree.tostring(self.tree, encoding="unicode")
+        return lxml.etree.tostring(self.tree, xml_declaration=True, encoding=encoding)
+
+
+_XPATH_STRING = lxml.etree.XPath("string()")
+
+
+def _create_lxml_parser():
+    """Create an lxml parser that builds _LxmlElement nodes and resolves no entities."""
+    parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+    parser.set_element_class_lookup(
+        lxml.etree.ElementDefaultClassLookup(element=_LxmlElement)
+    )
+    return parser
+
+
+def _clark_name(name, nsmap):
+    """Convert a prefixed name (e.g., "w:p") to lxml's {uri}local form, or None."""
+    if ":" in name:
+        prefix, local = name.split(":", 1)
+        uri = XML_NAMESPACE if prefix == "xml" else nsmap.get(prefix)
+        return f"{{{uri}}}{local}" if uri else None
+    uri = nsmap.get(None)
+    return f"{{{uri}}}{name}" if uri else name
+
+
+def _attribute_key(name, nsmap):
+    """Convert a prefixed attribute name to lxml's key; unprefixed names stay local."""
+    if ":" not in name:
+        return name
+    return _clark_name(name, nsmap)
+
+
+def _collect_lxml_text(elem, parts, runs, offset, own):
+    """Append non-whitespace text of elem like XMLEditor._get_element_text.
+
+    Records (start, end, run) for w:r elements owned by the paragraph being
+    walked; runs of nested paragraphs belong to those paragraphs.
+    """
+    if elem.text and elem.text.strip():
+        parts.append(elem.text)
+        offset[0] += len(elem.text)
+    for child in elem:
+        if isinstance(child.tag, str):
+            tag_name = child.tagName
+            child_own = own and tag_name != "w:p"
+            start = offset[0]
+            _collect_lxml_text(child, parts, runs, offset, child_own)
+            if child_own and tag_name == "w:r":
+                runs.append((start, offset[0], child))
+        if child.tail and child.tail.strip():
+            parts.append(child.tail)
+            offset[0] += len(child.tail)
+
+
+def _detach(elem):
+    """Remove elem from its parent, if any, leaving its tail text behind."""
+    if elem.getparent() is not None:
+        _remove_preserving_tail(elem)
+    elem.tail = None
+
+
+def _remove_preserving_tail(elem):
+    """Remove elem from its parent, keeping its tail text in the document."""
+    parent = elem.getparent()
+    if elem.tail:
+        previous = elem.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + elem.tail
+        else:
+            parent.text = (parent.text or "") + elem.tail
+    parent.remove(elem)
+
+
+class _NodeIndex:
+    """
+    Lookup tables backing XMLEditor.get_node.
+
+    Tables are built on first use: one per (tag, attribute) pair queried by
+    attribute value, and one per tag queried by line number. Nodes inserted
+    after a table was built are queued with add(), and elements whose
+    attributes changed with add_elements(); both are merged on the next
+    lookup, so attributes injected right after insertion are picked up.
+
+    Removed elements and stale attribute values are dropped at lookup time
+    rather than on removal, which keeps edits cheap. Results are candidates:
+    callers must still apply their own filters.
+    """
+
+    def __init__(self, dom):
+        self.dom = dom
+        # (tag, attr_name) -> {attr_value: {elem: None}} (dicts keep document order)
+        self._attr_tables = {}
+        # tag -> attribute names with a built table
+        self._indexed_attrs = {}
+        # tag -> ([line, ...], [elem, ...]) sorted by line
+        self._line_tables = {}
+        self._pending = []
+        self._pending_elements = []
+
+    def add(self, nodes):
+        """Queue inserted or modified subtrees for merging into built tables."""
+        self._pending.extend(nodes)
+
+    def add_elements(self, elems):
+        """Queue elements whose own attributes changed (not their subtrees)."""
+        self._pending_elements.extend(elems)
+
+    def by_attribute(self, tag, attr_name, attr_value):
+        """Return attached <tag> elements whose attr_name equals attr_value."""
+        self._merge_pending()
+        table = self._attr_tables.get((tag, attr_name))
+        if table is None:
+            table = {}
+            for elem in self.dom.getElementsByTagName(tag):
+                if elem.hasAttribute(attr_name):
+                    table.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+            self._attr_tables[(tag, attr_name)] = table
+            self._indexed_attrs.setdefault(tag, []).append(attr_name)
+
+        bucket = table.get(attr_value)
+        if not bucket:
+            return []
+        matches = []
+        for elem in list(bucket):
+            if elem.getAttribute(attr_name) == attr_value and _is_attached(
+                elem, self.dom
+            ):
+                matches.append(elem)
+            else:
+                del bucket[elem]
+        return matches
+
+    def by_line(self, tag, line_number):
+        """Return attached <tag> elements starting at a line or within a range."""
+        table = self._line_tables.get(tag)
+        if table is None:
+            entries = sorted(
+                (
+                    (elem.parse_position[0], elem)
+                    for elem in self.dom.getElementsByTagName(tag)
+                    if hasattr(elem, "parse_position")
+                ),
+                key=lambda entry: entry[0],
+            )
+            table = ([line for line, _ in entries], [elem for _, elem in entries])
+            self._line_tables[tag] = table
+
+        lines, elems = table
+        if isinstance(line_number, range):
+            if not line_number:
+                return []
+            low, high = min(line_number), max(line_number)
+        else:
+            low = high = line_number
+        start = bisect.bisect_left(lines, low)
+        stop = bisect.bisect_right(lines, high)
+        return [elem for elem in elems[start:stop] if _is_attached(elem, self.dom)]
+
+    def _merge_pending(self):
+        """Add queued subtrees and elements to every attribute table built so far."""
+        pending, self._pending = self._pending, []
+        elements, self._pending_elements = self._pending_elements, []
+        if not self._indexed_attrs:
+            return
+        for node in pending:
+            if node.nodeType == node.ELEMENT_NODE:
+                elements.extend(_iter_elements(node))
+        for elem in elements:
+            for attr_name in self._indexed_attrs.get(elem.tagName, ()):
+                if elem.hasAttribute(attr_name):
+                    table = self._attr_tables[(elem.tagName, attr_name)]
+                    table.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+
+
+class _TextIndex:
+    """
+    Paragraph-level text cache backing contains= lookups.
+
+    Holds the w:p elements in document order and, per paragraph, its text
+    (as returned by XMLEditor._get_element_text) plus the span each of its
+    own w:r elements covers in that text. Entries are computed on first use
+    and dropped when a paragraph is edited; the paragraph list is only
+    rebuilt when new paragraphs are inserted.
+    """
+
+    def __init__(self, dom, get_element_text):
+        self.dom = dom
+        self._get_element_text = get_element_text
+        self._paragraphs = None
+        self._known = set()
+        # w:p -> (text, [(start, end, w:r), ...])
+        self._entries = {}
+
+    def invalidate(self, nodes):
+        """Drop cached text for paragraphs affected by inserted or modified nodes."""
+        if self._paragraphs is None:
+            return
+        for node in nodes:
+            if node.nodeType != node.ELEMENT_NODE:
+                node = node.parentNode
+                if node is None or node.nodeType != node.ELEMENT_NODE:
+                    continue
+
+            # Enclosing paragraphs now have different text
+            parent = node.parentNode
+            while parent is not None and parent.nodeType == parent.ELEMENT_NODE:
+                if parent.tagName == "w:p":
+                    self._entries.pop(parent, None)
+                parent = parent.parentNode
+
+            # Paragraphs inside the subtree are either modified or new
+            inner = node.getElementsByTagName("w:p")
+            if node.tagName == "w:p":
+                inner = [node, *inner]
+            for para in inner:
+                self._entries.pop(para, None)
+                if para not in self._known:
+                    self._paragraphs = None
+
+    def invalidate_ancestors(self, nodes):
+        """Drop cached text for the paragraphs enclosing (or being) each node."""
+        if self._paragraphs is None:
+            return
+        for node in nodes:
+            while node is not None and node.nodeType != node.DOCUMENT_NODE:
+                if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:p":
+                    self._entries.pop(node, None)
+                node = node.parentNode
+
+    def containing(self, tag, text):
+        """Return attached w:p or w:r elements whose text contains text."""
+        matches = []
+        for para in self._get_paragraphs():
+            para_text, runs = self._get_entry(para)
+            if text not in para_text or not _is_attached(para, self.dom):
+                continue
+            if tag == "w:p":
+                matches.append(para)
+            else:
+                matches.extend(
+                    run for start, end, run in runs if text in para_text[start:end]
+                )
+        return matches
+
+    def find_runs(self, text):
+        """Return the runs covering each occurrence of text, per paragraph."""
+        occurrences = []
+        if not text:
+            return occurrences
+        for para in self._get_paragraphs():
+            para_text, runs = self._get_entry(para)
+            if text not in para_text or not _is_attached(para, self.dom):
+                continue
+            start = para_text.find(text)
+            while start != -1:
+                end = start + len(text)
+                covering = [
+                    run
+                    for run_start, run_end, run in runs
+                    if run_start < end and run_end > start
+                ]
+                if covering:
+                    occurrences.append(covering)
+                start = para_text.find(text, end)
+        return occurrences
+
+    def text_of(self, elem):
+        """Return the text of elem, using cached paragraph text where possible."""
+        if elem.tagName == "w:p":
+            return self._get_entry(elem)[0]
+        if elem.tagName == "w:r":
+            parent = elem.parentNode
+            while parent is not None and parent.nodeType == parent.ELEMENT_NODE:
+                if parent.tagName == "w:p":
+                    para_text, runs = self._get_entry(parent)
+                    for start, end, run in runs:
+                        if run is elem:
+                            return para_text[start:end]
+                    break
+                parent = parent.parentNode
+        return self._get_element_text(elem)
+
+    def _get_paragraphs(self):
+        if self._paragraphs is None:
+            self._paragraphs = self.dom.getElementsByTagName("w:p")
+            self._known = set(self._paragraphs)
+        return self._paragraphs
+
+    def _get_entry(self, para):
+        entry = self._entries.get(para)
+        if entry is None:
+            parts = []
+            runs = []
+            self._collect_text(para, parts, runs, [0], own=True)
+            entry = ("".join(parts), runs)
+            self._entries[para] = entry
+        return entry
+
+    def _collect_text(self, node, parts, runs, offset, own):
+        """Append text like _get_element_text, recording spans of own runs."""
+        for child in node.childNodes:
+            if child.nodeType == child.TEXT_NODE:
+                # Skip whitespace-only text nodes (XML formatting)
+                if child.data.strip():
+                    parts.append(child.data)
+                    offset[0] += len(child.data)
+            elif child.nodeType == child.ELEMENT_NODE:
+                # Runs of nested paragraphs (e.g., text boxes) belong to those paragraphs
+                child_own = own and child.tagName != "w:p"
+                start = offset[0]
+                self._collect_text(child, parts, runs, offset, child_own)
+                if child_own and child.tagName == "w:r":
+                    runs.append((start, offset[0], child))
+
+
+class _DomChanges:
+    """
+    Edits recorded on a _TrackedDocument since its editor last looked.
+
+    Falsy while nothing is pending, so checking it before every lookup is cheap.
+    """
+
+    __slots__ = ("attributes", "inserted", "text")
+
+    def __init__(self):
+        self.attributes = []  # Elements whose attributes changed
+        self.inserted = []  # Roots of inserted subtrees
+        self.text = []  # Text nodes whose data changed, parents of removed nodes
+
+    def __bool__(self):
+        return bool(self.attributes or self.inserted or self.text)
+
+    def drain(self):
+        """Return (attributes, inserted, text) and start recording afresh."""
+        drained = (self.attributes, self.inserted, self.text)
+        self.attributes, self.inserted, self.text = [], [], []
+        return drained
+
+    @staticmethod
+    def record(changed, node):
+        """Append node to a change list unless it was the last one recorded."""
+        if not changed or changed[-1] is not node:
+            changed.append(node)
+
+
+class _TrackedElement(minidom.Element):
+    """
+    minidom Element that records attribute changes and inserted children.
+
+    Only elements that have a parent record, so building a detached subtree
+    (e.g., importNode) costs nothing; the subtree is recorded as a whole when
+    it is inserted.
+    """
+
+    __slots__ = ()
+
+    def _changes(self):
+        if self.parentNode is None or self.ownerDocument is None:
+            return None
+        return self.ownerDocument._changes
+
+    def _attributes_changed(self):
+        changes = self._changes()
+        if changes is not None:
+            changes.record(changes.attributes, self)
+
+    def _inserted(self, node):
+        changes = self._changes()
+        if changes is not None:
+            changes.inserted.append(node)
+
+    def setAttribute(self, attname, value):
+        super().setAttribute(attname, value)
+        self._attributes_changed()
+
+    def setAttributeNS(self, namespaceURI, qualifiedName, value):
+        super().setAttributeNS(namespaceURI, qualifiedName, value)
+        self._attributes_changed()
+
+    def setAttributeNode(self, attr):
+        old = super().setAttributeNode(attr)
+        self._attributes_changed()
+        return old
+
+    setAttributeNodeNS = setAttributeNode
+
+    def removeAttribute(self, name):
+        super().removeAttribute(name)
+        self._attributes_changed()
+
+    def removeAttributeNS(self, namespaceURI, localName):
+        super().removeAttributeNS(namespaceURI, localName)
+        self._attributes_changed()
+
+    def removeAttributeNode(self, node):
+        removed = super().removeAttributeNode(node)
+        self._attributes_changed()
+        return removed
+
+    removeAttributeNodeNS = removeAttributeNode
+
+    def appendChild(self, node):
+        super().appendChild(node)
+        self._inserted(node)
+        return node
+
+    def insertBefore(self, newChild, refChild):
+        super().insertBefore(newChild, refChild)
+        self._inserted(newChild)
+        return newChild
+
+    def replaceChild(self, newChild, oldChild):
+        super().replaceChild(newChild, oldChild)
+        self._inserted(newChild)
+        return oldChild
+
+    def removeChild(self, oldChild):
+        # Also called by appendChild/insertBefore when moving an attached node
+        removed = super().removeChild(oldChild)
+        changes = self._changes()
+        if changes is not None:
+            changes.record(changes.text, self)
+        return removed
+
+
+class _TrackedText(minidom.Text):
+    """minidom Text node that records changes to its data once attached."""
+
+    __slots__ = ()
+
+    def _set_data(self, data):
+        self._data = data
+        if self.parentNode is not None and self.ownerDocument is not None:
+            changes = self.ownerDocument._changes
+            if changes is not None:
+                changes.record(changes.text, self)
+
+    # appendData, replaceData, etc. all assign data
+    data = nodeValue = property(minidom.Text._get_data, _set_data)
+
+
+class _TrackedDocument(minidom.Document):
+    """
+    minidom Document whose elements and text nodes report direct edits.
+
+    XMLEditor sets _changes after parsing; until then (and for documents it
+    did not parse) nothing is recorded.
+    """
+
+    _changes = None
+
+    # Same as minidom.Document's factories, with the node classes swapped
+    def createElement(self, tagName):
+        elem = _TrackedElement(tagName)
+        elem.ownerDocument = self
+        return elem
+
+    def createElementNS(self, namespaceURI, qualifiedName):
+        prefix, _ = minidom._nssplit(qualifiedName)
+        elem = _TrackedElement(qualifiedName, namespaceURI, prefix)
+        elem.ownerDocument = self
+        return elem
+
+    def createTextNode(self, data):
+        if not isinstance(data, str):
+            raise TypeError("node contents must be a string")
+        text = _TrackedText()
+        text._data = data
+        text.ownerDocument = self
+        return text
+
+
+class _TrackedDOMImplementation(minidom.DOMImplementation):
+    def _create_document(self):
+        return _TrackedDocument()
+
+
+_PATH_STEP = re.compile(r"((?:[\w.-]+:)?[\w.-]+)\[(\d+)\]")
+
+
+def _parse_path_step(path, step):
+    """Split a get_path step "prefix:name[n]" into (name, n)."""
+    match = _PATH_STEP.fullmatch(step)
+    if not match or int(match.group(2)) < 1:
+        raise ValueError(f"Invalid path: {path}. Bad step '{step}'.")
+    return match.group(1), int(match.group(2))
+
+
+def _write_atomic(path, data):
+    """Write bytes to path through a temporary file in the same directory and rename.
+
+    Readers never see a partial file, and the old file's inode (and any hard
+    links to it) is left untouched.
+    """
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if path.exists():
+            os.chmod(temp_name, stat.S_IMODE(path.stat().st_mode))
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def _digest(content):
+    """
+    Fingerprint XML bytes to detect changes made directly on an lxml tree.
+
+    The XML declaration and whitespace around the root are skipped, since
+    serializing an unchanged file may write them differently.
+    """
+    if content.startswith(b"<?xml"):
+        content = content[content.find(b"?>") + 2 :]
+    return hashlib.blake2b(content.strip(), digest_size=16).digest()
+
+
+def _is_attached(node, dom):
+    """Check whether node is still part of dom (removed nodes have no parent)."""
+    while node is not None:
+        if node is dom:
+            return True
+        node = node.parentNode
+    return False
+
+
+def _document_position(node):
+    """Return a sort key placing node in document order."""
+    path = []
+    while node.parentNode is not None:
+        parent = node.parentNode
+        path.append(parent.childNodes.index(node))
+        node = parent
+    return path[::-1]
+
+
+def _iter_elements(node):
+    """Yield node and all of its descendant elements in document order."""
+    stack = [node]
+    while stack:
+        elem = stack.pop()
+        yield elem
+        stack.extend(
+            child
+            for child in reversed(elem.childNodes)
+            if child.nodeType == child.ELEMENT_NODE
+        )
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
@@ -366,6 +1849,8 @@ def _create_line_tracking_parser():
 
         orig_start_cb = dom_handler.startElementNS
         dom_handler.startElementNS = startElementNS
+        # Build the DOM from nodes that report later edits (see XMLEditor)
+        dom_handler.documentFactory = _TrackedDOMImplementation()
         orig_set_content_handler(dom_handler)
 
     parser = defusedxml.sax.make_parser()
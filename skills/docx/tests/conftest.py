@@ -0,0 +1,99 @@
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+# Tests import the skill the way its scripts do: from the skills/docx directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+  <Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>
+</Types>
+"""
+
+PACKAGE_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>
+"""
+
+DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>
+</Relationships>
+"""
+
+SETTINGS = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings xmlns:w="{W_NS}">
+  <w:defaultTabStop w:val="720"/>
+</w:settings>
+"""
+
+DOCUMENT = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}" xmlns:w14="{W14_NS}">
+  <w:body>
+    <w:p w14:paraId="10000001" w14:textId="20000001">
+      <w:r>
+        <w:t>The quick brown fox</w:t>
+      </w:r>
+    </w:p>
+    <w:p w14:paraId="10000002" w14:textId="20000002">
+      <w:r>
+        <w:t xml:space="preserve">Effective </w:t>
+      </w:r>
+      <w:r>
+        <w:rPr>
+          <w:b/>
+        </w:rPr>
+        <w:t>Date</w:t>
+      </w:r>
+      <w:r>
+        <w:t xml:space="preserve"> of this Agreement</w:t>
+      </w:r>
+    </w:p>
+    <w:p w14:paraId="10000003" w14:textId="20000003">
+      <w:r>
+        <w:t>Jumps over the lazy dog</w:t>
+      </w:r>
+    </w:p>
+    <w:sectPr/>
+  </w:body>
+</w:document>
+"""
+
+PARTS = {
+    "[Content_Types].xml": CONTENT_TYPES,
+    "_rels/.rels": PACKAGE_RELS,
+    "word/document.xml": DOCUMENT,
+    "word/_rels/document.xml.rels": DOCUMENT_RELS,
+    "word/settings.xml": SETTINGS,
+}
+
+
+@pytest.fixture
+def unpacked(tmp_path):
+    """A minimal unpacked .docx: three paragraphs, no comments or tracked changes."""
+    root = tmp_path / "unpacked"
+    for name, content in PARTS.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def docx_file(tmp_path, unpacked):
+    """The unpacked fixture zipped into a .docx file."""
+    path = tmp_path / "input.docx"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name in PARTS:
+            zf.write(unpacked / name, name)
+    return path
@@ -0,0 +1,170 @@
+import functools
+import sys
+import zipfile
+
+import pytest
+
+from ooxml.scripts.converter import (
+    ConversionTimeout,
+    ConverterCrashed,
+    ConverterPool,
+    FakeConverter,
+    SofficeConverter,
+)
+
+# Stand-in for soffice: server mode (--accept) listens on the port from a
+# child process, like soffice.bin under oosplash; client mode (--convert-to)
+# writes the output, hangs for names containing "hang" and fails for "bad"
+FAKE_SOFFICE = f"""#!{sys.executable}
+import os, re, socket, sys, time
+
+args = sys.argv[1:]
+accept = [arg for arg in args if arg.startswith("--accept=")]
+if accept:
+    port = int(re.search(r"port=(\\d+)", accept[0]).group(1))
+    if os.fork() == 0:
+        server = socket.socket()
+        server.bind(("127.0.0.1", port))
+        server.listen()
+        while True:
+            server.accept()[0].close()
+    os.wait()
+else:
+    outdir = args[args.index("--outdir") + 1]
+    doc = args[-1]
+    if "hang" in doc:
+        time.sleep(30)
+    if "bad" in doc:
+        sys.exit("Error: source file could not be loaded")
+    stem = os.path.splitext(os.path.basename(doc))[0]
+    open(os.path.join(outdir, stem + ".html"), "w").write("<html/>")
+"""
+
+
+class CountingFactory:
+    """Converter factory that records every converter it creates."""
+
+    def __init__(self, *crash_after):
+        self.crash_after = list(crash_after)
+        self.created = []
+
+    def __call__(self):
+        crash_after = self.crash_after.pop(0) if self.crash_after else None
+        converter = FakeConverter(crash_after=crash_after)
+        self.created.append(converter)
+        return converter
+
+
+class HangingConverter(FakeConverter):
+    def convert(self, doc_path, filter_name, outdir):
+        self.jobs += 1
+        raise ConversionTimeout(f"Timeout converting {doc_path}")
+
+
+def test_fake_converter_converts_valid_package(docx_file, tmp_path):
+    converter = FakeConverter()
+    converter.start()
+    output = converter.convert(docx_file, "html:HTML", tmp_path)
+    assert output == tmp_path / "input.html"
+    assert output.exists()
+
+
+def test_fake_converter_rejects_malformed_xml(docx_file, tmp_path):
+    broken = tmp_path / "broken.docx"
+    with zipfile.ZipFile(docx_file) as source, zipfile.ZipFile(broken, "w") as target:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename == "word/document.xml":
+                data = data.replace(b"</w:body>", b"")
+            target.writestr(info, data)
+
+    with pytest.raises(ValueError, match="broken.docx"):
+        FakeConverter().convert(broken, "html:HTML", tmp_path)
+
+    not_a_zip = tmp_path / "plain.docx"
+    not_a_zip.write_text("not a zip")
+    with pytest.raises(ValueError):
+        FakeConverter().convert(not_a_zip, "html:HTML", tmp_path)
+
+
+def test_pool_recycles_converters_after_jobs_per_worker(docx_file, tmp_path):
+    factory = CountingFactory()
+    with ConverterPool(size=1, jobs_per_worker=2, converter_factory=factory) as pool:
+        for _ in range(5):
+            assert pool.convert(docx_file, tmp_path).exists()
+
+    assert [converter.jobs for converter in factory.created] == [2, 2, 1]
+    assert not any(converter.alive() for converter in factory.created)
+
+
+def test_pool_retries_job_once_after_crash(docx_file, tmp_path):
+    factory = CountingFactory(1)
+    with ConverterPool(size=1, converter_factory=factory) as pool:
+        assert pool.convert(docx_file, tmp_path).exists()
+
+    crashed, replacement = factory.created
+    assert not crashed.alive()
+    assert replacement.jobs == 1
+
+
+def test_pool_gives_up_after_second_crash(docx_file, tmp_path):
+    factory = CountingFactory(1, 1, None)
+    with ConverterPool(size=1, converter_factory=factory) as pool:
+        with pytest.raises(ConverterCrashed):
+            pool.convert(docx_file, tmp_path)
+        # The slot gets a fresh converter for the next job
+        assert pool.convert(docx_file, tmp_path).exists()
+    assert len(factory.created) == 3
+
+
+def test_pool_does_not_retry_timeout(docx_file, tmp_path):
+    created = []
+
+    def factory():
+        created.append(HangingConverter())
+        return created[-1]
+
+    with ConverterPool(size=1, converter_factory=factory) as pool:
+        with pytest.raises(ConversionTimeout):
+            pool.convert(docx_file, tmp_path)
+        assert not pool.validate(docx_file)
+    assert [converter.jobs for converter in created] == [1, 1]
+
+
+def test_pool_submit_and_validate(docx_file, tmp_path):
+    bad = tmp_path / "bad.docx"
+    bad.write_text("not a zip")
+    with ConverterPool(size=2, converter_factory=FakeConverter) as pool:
+        futures = [pool.submit(docx_file, tmp_path) for _ in range(4)]
+        assert all(future.result().exists() for future in futures)
+        assert pool.validate(docx_file)
+        assert not pool.validate(bad)
+        with pytest.raises(ValueError, match="must be a .docx"):
+            pool.convert(tmp_path / "notes.txt", tmp_path)
+
+
+@pytest.fixture
+def fake_soffice(tmp_path):
+    path = tmp_path / "soffice"
+    path.write_text(FAKE_SOFFICE)
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_soffice_converter_lifecycle(fake_soffice, docx_file, tmp_path):
+    factory = functools.partial(SofficeConverter, timeout=1, executable=fake_soffice)
+    with ConverterPool(size=1, converter_factory=factory) as pool:
+        assert pool.convert(docx_file, tmp_path) == tmp_path / "input.html"
+
+        bad = tmp_path / "bad.docx"
+        bad.write_bytes(docx_file.read_bytes())
+        with pytest.raises(ValueError, match="could not be loaded"):
+            pool.convert(bad, tmp_path)
+
+        hang = tmp_path / "hang.docx"
+        hang.write_bytes(docx_file.read_bytes())
+        with pytest.raises(ConversionTimeout):
+            pool.convert(hang, tmp_path)
+
+        # The timed-out office was replaced
+        assert pool.validate(docx_file)
@@ -0,0 +1,152 @@
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from scripts.document import (
+    ChangeIdAllocator,
+    Document,
+    HexIdAllocator,
+    WorkspacePool,
+)
+
+ENGINES = ["minidom", "lxml"]
+
+
+@pytest.fixture(params=ENGINES)
+def doc(request, unpacked):
+    with Document(unpacked, engine=request.param, seed=1) as doc:
+        yield doc
+
+
+def test_save_writes_direct_dom_edits(doc, unpacked):
+    para = doc["word/document.xml"].get_node(
+        tag="w:p", attrs={"w14:paraId": "10000001"}
+    )
+    para.setAttribute("w14:textId", "2ABCDEF0")
+    doc.save(validate=False)
+
+    assert 'w14:textId="2ABCDEF0"' in (unpacked / "word/document.xml").read_text()
+
+
+def test_save_skips_parts_that_were_only_read(doc):
+    doc.save(validate=False)
+    editor = doc["word/document.xml"]
+    part = editor.xml_path
+    inode = part.stat().st_ino
+
+    editor.get_node(tag="w:p", contains="lazy dog")
+    doc.save(validate=False)
+
+    assert not editor.dirty
+    assert part.stat().st_ino == inode
+
+
+def test_workspace_pool_defaults_to_temp_dir(unpacked, tmp_path):
+    with WorkspacePool(root=tmp_path) as pool:
+        with Document(unpacked, workspace_pool=pool) as doc:
+            # Same filesystem as the source, so parts are hard-linked
+            part = doc.unpacked_path / "word/settings.xml"
+            assert part.stat().st_ino == (unpacked / "word/settings.xml").stat().st_ino
+            workspace = doc.temp_dir
+        assert pool.acquire() == workspace
+
+    with WorkspacePool() as pool:
+        assert pool.root.parent == Path(tempfile.gettempdir())
+
+
+def test_suggest_deletions_rejects_nested_elements(doc):
+    editor = doc["word/document.xml"]
+    para = editor.get_node(tag="w:p", contains="Effective Date")
+    run = editor.get_node(tag="w:r", contains="Date")
+    before = editor._serialize()
+
+    with pytest.raises(ValueError, match="enclosing <w:p>"):
+        editor.suggest_deletions([para, run])
+    assert editor._serialize() == before
+
+
+def test_revert_deletions_rejects_nested_elements(doc):
+    editor = doc["word/document.xml"]
+    para = editor.get_node(tag="w:p", contains="lazy dog")
+    editor.suggest_deletion(para)
+    deletion = para.getElementsByTagName("w:del")[0]
+    before = editor._serialize()
+
+    with pytest.raises(ValueError, match="enclosing <w:p>"):
+        editor.revert_deletions([para, deletion])
+    assert editor._serialize() == before
+
+
+def _review(doc):
+    # Module-level so Document.map can pickle it
+    editor = doc["word/document.xml"]
+    para = editor.get_node(tag="w:p", contains="quick brown")
+    doc.add_comment(start=para, end=para, text="Check")
+    editor.suggest_deletion(editor.get_node(tag="w:r", contains="lazy dog"))
+    xml = editor.dom.toxml()
+    # Timestamps differ between runs
+    return re.sub(r'(w:date|w16du:dateUtc)="[^"]*"', "", xml)
+
+
+def test_map_matches_serial_run(unpacked, docx_file, tmp_path):
+    paths = [unpacked, docx_file]
+    for i in range(3):
+        paths.append(shutil.copy(docx_file, tmp_path / f"copy{i}.docx"))
+    paths.append(tmp_path / "missing.docx")
+
+    results = {r.path: r for r in Document.map(paths, _review, workers=2, seed=1)}
+
+    assert set(results) == set(paths)
+    assert "missing.docx" in results[tmp_path / "missing.docx"].error
+    for path in paths[:-1]:
+        open_doc = Document if path.is_dir() else Document.open_docx
+        with open_doc(path, seed=1) as doc:
+            expected = _review(doc)
+        assert results[path].error is None
+        assert results[path].value == expected
+
+
+CHANGES = """<w:p><w:pPr><w:pPrChange w:id="41" w:author="A"><w:pPr/></w:pPrChange></w:pPr>
+<w:r><w:rPr><w:rPrChange w:id="40" w:author="A"><w:rPr/></w:rPrChange></w:rPr></w:r>
+<w:moveFromRangeStart w:id="42" w:author="A" w:name="m"/></w:p>"""
+
+
+def test_change_ids_skip_ids_in_any_part(unpacked):
+    document = unpacked / "word/document.xml"
+    text = document.read_text()
+    document.write_text(text.replace("<w:sectPr/>", CHANGES + "<w:sectPr/>"))
+    (unpacked / "word/footnotes.xml").write_text(
+        '<w:footnotes xmlns:w="http://w"><w:ins w:id="7"/></w:footnotes>'
+    )
+
+    assert ChangeIdAllocator.for_package(unpacked).allocate() == 43
+
+
+def test_change_ids_observe_inserted_change_elements(doc):
+    editor = doc["word/document.xml"]
+    para = editor.get_node(tag="w:p", contains="lazy dog")
+    (run,) = editor.insert_after(
+        para.getElementsByTagName("w:r")[0],
+        '<w:r><w:rPr><w:rPrChange w:id="90" w:author="A"><w:rPr/></w:rPrChange>'
+        "</w:rPr><w:t>new</w:t></w:r>",
+    )
+
+    deletion = editor.suggest_deletion(run)
+    assert deletion.getAttribute("w:id") == "91"
+
+
+def test_hex_ids_skip_ids_in_any_part(unpacked, monkeypatch):
+    (unpacked / "word/commentsIds.xml").write_text(
+        '<w16cid:commentsIds xmlns:w16cid="http://cid">'
+        '<w16cid:commentId w16cid:paraId="0000000A" w16cid:durableId="0000000B"/>'
+        "</w16cid:commentsIds>"
+    )
+    hex_ids = HexIdAllocator.for_package(unpacked, seed=1)
+    # Offer every existing ID (document paraIds/textIds, commentsIds) first
+    candidates = iter([0x10000001, 0x20000003, 0x0A, 0x0B, 0x0C])
+    monkeypatch.setattr(hex_ids._random, "randint", lambda a, b: next(candidates))
+
+    assert hex_ids.allocate() == "0000000C"
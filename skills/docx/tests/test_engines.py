@@ -0,0 +1,93 @@
+"""The same edits through the minidom and lxml engines must give the same XML."""
+
+import re
+import shutil
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from scripts.document import Document
+
+# Timestamps depend on when the edit ran
+_DATES = re.compile(rb'\s[\w:]*(?:date|dateUtc)="[^"]*"', re.IGNORECASE)
+
+
+def _canonical(path):
+    """Canonical XML of a part, without timestamps and formatting whitespace."""
+    data = _DATES.sub(b"", path.read_bytes())
+    return ElementTree.canonicalize(data.decode("utf-8"), strip_text=True)
+
+
+def _edit_and_save(unpacked, engine, edit):
+    with Document(
+        unpacked, engine=engine, seed=7, rsid="00A1B2C3", track_revisions=True
+    ) as doc:
+        edit(doc, doc["word/document.xml"])
+        doc.save(validate=False)
+    return {
+        path.relative_to(unpacked).as_posix(): _canonical(path)
+        for path in sorted(unpacked.rglob("*"))
+        if path.name.endswith((".xml", ".rels"))
+    }
+
+
+def add_comment_and_reply(doc, editor):
+    first = editor.get_node(tag="w:p", contains="quick brown")
+    last = editor.get_node(tag="w:p", contains="lazy dog")
+    comment_id = doc.add_comment(start=first, end=last, text="Check this range")
+    doc.reply_to_comment(parent_comment_id=comment_id, text="Looks fine")
+
+
+def suggest_deletions(doc, editor):
+    editor.suggest_deletion(editor.get_node(tag="w:r", contains="Date"))
+    editor.suggest_deletion(editor.get_node(tag="w:p", contains="lazy dog"))
+
+
+def replace_and_insert(doc, editor):
+    run = editor.get_node(tag="w:r", contains="quick brown")
+    (new_run,) = editor.replace_node(run, "<w:r><w:t>The quick red fox</w:t></w:r>")
+    editor.insert_after(
+        new_run, '<w:ins><w:r><w:t xml:space="preserve"> runs</w:t></w:r></w:ins>'
+    )
+    para = editor.get_node(tag="w:p", contains="lazy dog")
+    editor.insert_before(
+        para, editor.suggest_paragraph("<w:p><w:r><w:t>New paragraph</w:t></w:r></w:p>")
+    )
+
+
+def revert_tracked_changes(doc, editor):
+    replace_and_insert(doc, editor)
+    suggest_deletions(doc, editor)
+    body = editor.dom.getElementsByTagName("w:body")[0]
+    editor.revert_insertions([body])
+    editor.revert_deletion(editor.get_node(tag="w:p", contains="lazy dog"))
+
+
+def find_and_delete_runs(doc, editor):
+    editor.suggest_deletions(
+        run for runs in editor.find_runs("Effective Date") for run in runs
+    )
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        add_comment_and_reply,
+        suggest_deletions,
+        replace_and_insert,
+        revert_tracked_changes,
+        find_and_delete_runs,
+    ],
+)
+def test_engines_produce_the_same_parts(tmp_path, unpacked, edit):
+    original = _canonical(unpacked / "word/document.xml")
+    results = {}
+    for engine in ("minidom", "lxml"):
+        copy = tmp_path / engine
+        shutil.copytree(unpacked, copy)
+        results[engine] = _edit_and_save(copy, engine, edit)
+
+    assert results["minidom"]["word/document.xml"] != original
+    assert results["minidom"].keys() == results["lxml"].keys()
+    for name, minidom_xml in results["minidom"].items():
+        assert results["lxml"][name] == minidom_xml, name
@@ -0,0 +1,189 @@
+import multiprocessing
+import os
+import shutil
+import zipfile
+
+import defusedxml.minidom
+import lxml.etree
+import pytest
+
+from ooxml.scripts import pack
+from ooxml.scripts.pack import (
+    condense_xml_bytes,
+    content_hash,
+    copy_member_raw,
+    pack_document,
+)
+
+
+def test_pack_document_condenses_parts(unpacked, tmp_path):
+    output = tmp_path / "out.docx"
+    assert pack_document(unpacked, output)
+
+    with zipfile.ZipFile(output) as zf:
+        document = zf.read("word/document.xml")
+    assert b">\n" not in document
+    assert b'<w:t xml:space="preserve">Effective </w:t>' in document
+
+
+def test_pack_document_in_pool_worker(unpacked, tmp_path):
+    # Pool workers are daemonic and cannot start a pool of their own
+    output = tmp_path / "out.docx"
+    with multiprocessing.Pool(1) as pool:
+        assert pool.apply(pack_document, (unpacked, output), {"workers": 2})
+    assert zipfile.is_zipfile(output)
+
+
+@pytest.mark.parametrize("raw", [True, False], ids=["raw", "public-api"])
+def test_copy_member_raw(docx_file, tmp_path, monkeypatch, raw):
+    monkeypatch.setattr(pack, "_RAW_COPY_SUPPORTED", raw)
+    output = tmp_path / "copy.docx"
+    with (
+        zipfile.ZipFile(docx_file) as source,
+        zipfile.ZipFile(output, "w") as target,
+    ):
+        for info in source.infolist():
+            copy_member_raw(source, target, info)
+        target.writestr("word/new.xml", "<new/>")
+
+    with zipfile.ZipFile(docx_file) as source, zipfile.ZipFile(output) as copied:
+        assert copied.testzip() is None
+        for info in source.infolist():
+            assert copied.read(info.filename) == source.read(info)
+            assert copied.getinfo(info.filename).compress_type == info.compress_type
+        assert copied.read("word/new.xml") == b"<new/>"
+
+
+def test_pack_document_compression_profiles(unpacked, tmp_path):
+    (unpacked / "word/media").mkdir()
+    (unpacked / "word/media/image1.png").write_bytes(b"\x89PNG" + bytes(4096))
+    (unpacked / "word/media/image2.emf").write_bytes(bytes(4096))
+
+    sizes = {}
+    for profile in ("draft", "smallest"):
+        output = tmp_path / f"{profile}.docx"
+        pack_document(unpacked, output, compression=profile)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            png = zf.getinfo("word/media/image1.png")
+            emf = zf.getinfo("word/media/image2.emf")
+        assert png.compress_type == zipfile.ZIP_STORED
+        assert emf.compress_type == zipfile.ZIP_DEFLATED
+        sizes[profile] = output.stat().st_size
+    assert sizes["smallest"] <= sizes["draft"]
+
+
+def test_deterministic_pack_depends_only_on_content(unpacked, tmp_path):
+    first = tmp_path / "first.docx"
+    pack_document(unpacked, first, deterministic=True)
+
+    # Same content copied elsewhere, with other timestamps and permissions
+    copy = tmp_path / "copy"
+    shutil.copytree(unpacked, copy)
+    for path in copy.rglob("*"):
+        os.utime(path, (0, 1_000_000_000))
+    (copy / "word/settings.xml").chmod(0o600)
+    second = tmp_path / "second.docx"
+    pack_document(copy, second, deterministic=True)
+
+    assert content_hash(first) == content_hash(second)
+    with zipfile.ZipFile(first) as zf:
+        assert zf.namelist()[0] == "[Content_Types].xml"
+        assert {info.date_time for info in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+
+    text = (copy / "word/document.xml").read_text()
+    (copy / "word/document.xml").write_text(text.replace("lazy", "sleepy"))
+    changed = tmp_path / "changed.docx"
+    pack_document(copy, changed, deterministic=True)
+    assert content_hash(changed) != content_hash(first)
+
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+
+MIXED = f"""{DECLARATION}
+<w:body {W}>
+  <w:p>
+    <!-- comment -->
+    <w:r><w:t>a</w:t></w:r> tail text
+    <w:r><w:t>b</w:t></w:r>
+  </w:p>
+</w:body>
+"""
+
+PRESERVED = f"""{DECLARATION}
+<w:p {W}>
+  <w:r><w:t xml:space="preserve">  leading and trailing  </w:t></w:r>
+  <w:r><w:t xml:space="preserve"> </w:t></w:r>
+  <w:r><w:instrText xml:space="preserve"> PAGE </w:instrText></w:r>
+</w:p>
+"""
+
+
+def _minidom_condense(content):
+    """The DOM-based condense_xml_bytes that the streaming condenser replaced."""
+    dom = defusedxml.minidom.parseString(content)
+    for element in dom.getElementsByTagName("*"):
+        if element.tagName.endswith(":t"):
+            continue
+        for child in list(element.childNodes):
+            if (
+                child.nodeType == child.TEXT_NODE
+                and child.nodeValue
+                and child.nodeValue.strip() == ""
+            ) or child.nodeType == child.COMMENT_NODE:
+                element.removeChild(child)
+    return dom.toxml(encoding="UTF-8")
+
+
+def _canonical(content):
+    return lxml.etree.tostring(lxml.etree.fromstring(content), method="c14n")
+
+
+def _streamed(content):
+    output = []
+    pack._condense([content], output.append)
+    return b"".join(output)
+
+
+def test_condense_keeps_mixed_content():
+    condensed = condense_xml_bytes(MIXED.encode())
+
+    assert (
+        condensed
+        == (
+            f"{DECLARATION}<w:body {W}><w:p><w:r><w:t>a</w:t></w:r> tail text\n    "
+            "<w:r><w:t>b</w:t></w:r></w:p></w:body>"
+        ).encode()
+    )
+
+
+def test_condense_keeps_preserved_text():
+    condensed = condense_xml_bytes(PRESERVED.encode())
+
+    assert b'<w:t xml:space="preserve">  leading and trailing  </w:t>' in condensed
+    assert b'<w:t xml:space="preserve"> </w:t>' in condensed
+    assert b'<w:instrText xml:space="preserve"> PAGE </w:instrText>' in condensed
+    assert b">\n" not in condensed
+
+
+def test_condense_matches_minidom_condense(unpacked):
+    document = (unpacked / "word/document.xml").read_bytes()
+    for content in (document, MIXED.encode(), PRESERVED.encode()):
+        condensed = condense_xml_bytes(content)
+
+        assert _canonical(condensed) == _canonical(_minidom_condense(content))
+        # Condensing is idempotent, and the fast path for condensed input agrees
+        assert condense_xml_bytes(condensed) == condensed
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_condense_fast_path_matches_streaming(newline):
+    # Condensed apart from the whitespace outside the root, as Word writes it
+    content = f"{DECLARATION}{newline}<w:p {W}><w:r><w:t> </w:t></w:r></w:p>{newline}"
+    assert pack._is_condensed(content.encode())
+
+    assert condense_xml_bytes(content.encode()) == _streamed(content.encode())
+    assert condense_xml_bytes(content.encode()).startswith(
+        f"{DECLARATION}<w:p ".encode()
+    )
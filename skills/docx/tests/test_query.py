@@ -0,0 +1,130 @@
+import lxml.etree
+import pytest
+
+from scripts.document import Document
+from scripts.query import (
+    _release,
+    iter_comments,
+    iter_paragraphs,
+    iter_revisions,
+    iter_runs,
+)
+from scripts.utilities import XMLEditor
+
+
+@pytest.fixture
+def word(unpacked):
+    """The unpacked fixture with a comment, a deletion and an insertion."""
+    with Document(unpacked, seed=1) as doc:
+        editor = doc["word/document.xml"]
+        first = editor.get_node(tag="w:p", contains="quick brown")
+        doc.add_comment(start=first, end=first, text="Check this")
+        editor.suggest_deletion(editor.get_node(tag="w:r", contains="Date"))
+        editor.insert_after(
+            editor.get_node(tag="w:r", contains="lazy dog"),
+            "<w:ins><w:r><w:t> and the cat</w:t></w:r></w:ins>",
+        )
+        doc.save(validate=False)
+    return unpacked / "word"
+
+
+def _elements(editor, *tags):
+    return [e for e in editor.dom.getElementsByTagName("*") if e.tagName in tags]
+
+
+def _text(elem, *tags):
+    return "".join(
+        t.firstChild.data
+        for t in elem.getElementsByTagName("*")
+        if t.tagName in tags and t.firstChild
+    )
+
+
+def _revision(elem):
+    parent = elem.parentNode
+    while parent.nodeType == parent.ELEMENT_NODE:
+        if parent.tagName in ("w:ins", "w:del"):
+            return parent.tagName[2:]
+        parent = parent.parentNode
+    return None
+
+
+def test_paragraphs_match_dom(word):
+    editor = XMLEditor(word / "document.xml")
+    paragraphs = list(iter_paragraphs(word / "document.xml"))
+
+    assert [p.text for p in paragraphs] == [
+        "The quick brown fox",
+        "Effective  of this Agreement",
+        "Jumps over the lazy dog and the cat",
+    ]
+    elems = _elements(editor, "w:p")
+    assert len(paragraphs) == len(elems)
+    for para, elem in zip(paragraphs, elems):
+        assert para.line == elem.parse_position[0]
+        assert para.para_id == elem.getAttribute("w14:paraId")
+        assert para.text == _text(elem, "w:t")
+        assert para.path == editor.get_path(elem)
+        assert editor.get_node_by_path(para.path) is elem
+
+
+def test_runs_match_dom(word):
+    editor = XMLEditor(word / "document.xml")
+    runs = list(iter_runs(word / "document.xml"))
+
+    assert [(r.text, r.revision) for r in runs if r.revision] == [
+        ("Date", "del"),
+        (" and the cat", "ins"),
+    ]
+    elems = _elements(editor, "w:r")
+    assert len(runs) == len(elems)
+    for run, elem in zip(runs, elems):
+        assert run.line == elem.parse_position[0]
+        assert run.text == _text(elem, "w:t", "w:delText")
+        assert run.revision == _revision(elem)
+        assert editor.get_node_by_path(run.path) is elem
+
+
+def test_revisions_match_dom(word):
+    editor = XMLEditor(word / "document.xml")
+    revisions = list(iter_revisions(word / "document.xml"))
+
+    assert [(r.kind, r.text) for r in revisions] == [
+        ("del", "Date"),
+        ("ins", " and the cat"),
+    ]
+    assert revisions == [
+        (
+            elem.tagName[2:],
+            elem.parse_position[0],
+            elem.getAttribute("w:id"),
+            elem.getAttribute("w:author"),
+            elem.getAttribute("w:date"),
+            _text(elem, "w:t", "w:delText"),
+        )
+        for elem in _elements(editor, "w:ins", "w:del")
+    ]
+
+
+def test_comments_match_dom(word):
+    editor = XMLEditor(word / "comments.xml")
+    (comment,) = iter_comments(word / "comments.xml")
+
+    (elem,) = _elements(editor, "w:comment")
+    assert comment == (
+        elem.parse_position[0],
+        elem.getAttribute("w:id"),
+        elem.getAttribute("w:author"),
+        elem.getAttribute("w:date"),
+        elem.getAttribute("w:initials"),
+        "Check this",
+    )
+
+
+def test_release_frees_element_and_processed_siblings():
+    root = lxml.etree.fromstring("<a><b>1</b><c>2</c>tail<d>3</d></a>")
+    c = root[1]
+    _release(c)
+
+    assert [child.tag for child in root] == ["c", "d"]
+    assert c.text is None and c.tail == "tail"
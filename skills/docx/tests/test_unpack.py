@@ -0,0 +1,20 @@
+import multiprocessing
+
+from ooxml.scripts.unpack import unpack_document
+
+
+def test_unpack_document_formats_selected_parts(docx_file, tmp_path):
+    output = tmp_path / "out"
+    formatted = unpack_document(docx_file, output, parts=["word/document.xml"])
+
+    assert formatted == ["word/document.xml"]
+    assert (output / "word/document.xml").read_text().count("\n") > 20
+    assert (output / "word/settings.xml").exists()
+
+
+def test_unpack_document_in_pool_worker(docx_file, tmp_path):
+    # Pool workers are daemonic and cannot start a pool of their own
+    output = tmp_path / "out"
+    with multiprocessing.Pool(1) as pool:
+        formatted = pool.apply(unpack_document, (docx_file, output), {"workers": 2})
+    assert "word/document.xml" in formatted
@@ -0,0 +1,205 @@
+import pytest
+
+from ooxml.scripts.pack import condense_xml_bytes
+from scripts.utilities import LxmlXMLEditor, XMLEditor
+
+EDITORS = [XMLEditor, LxmlXMLEditor]
+
+
+@pytest.fixture(params=EDITORS, ids=["minidom", "lxml"])
+def editor(request, unpacked):
+    return request.param(unpacked / "word" / "document.xml")
+
+
+def test_get_node_by_attribute(editor):
+    para = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000002"})
+    assert para.getAttribute("w14:textId") == "20000002"
+
+
+def test_attribute_lookup_sees_direct_set_attribute(editor):
+    # Build the attribute index, then change an attribute behind its back
+    editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+    para = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000003"})
+    para.setAttribute("w14:paraId", "7FFFFFFF")
+
+    assert editor.get_node(tag="w:p", attrs={"w14:paraId": "7FFFFFFF"}) is para
+    assert editor.find_nodes(tag="w:p", attrs={"w14:paraId": "10000003"}) == []
+
+
+def test_attribute_lookup_sees_direct_duplicate(editor):
+    editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+    second = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000002"})
+    second.setAttribute("w14:paraId", "10000001")
+
+    assert len(editor.find_nodes(tag="w:p", attrs={"w14:paraId": "10000001"})) == 2
+    with pytest.raises(ValueError, match="Multiple nodes"):
+        editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+
+
+def test_attribute_lookup_sees_direct_remove_attribute(editor):
+    para = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000002"})
+    para.removeAttribute("w14:paraId")
+
+    assert editor.find_nodes(tag="w:p", attrs={"w14:paraId": "10000002"}) == []
+
+
+def test_attribute_lookup_sees_directly_appended_element(editor):
+    editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+    body = editor.dom.getElementsByTagName("w:body")[0]
+    (new_para,) = editor.parse_fragments(['<w:p w14:paraId="7EEEEEEE"/>'])[0]
+    # minidom and lxml name the append differently
+    if isinstance(editor, LxmlXMLEditor):
+        body.append(new_para)
+    else:
+        body.appendChild(new_para)
+
+    found = editor.get_node(tag="w:p", attrs={"w14:paraId": "7EEEEEEE"})
+    assert found.getAttribute("w14:paraId") == "7EEEEEEE"
+
+
+def test_missing_attribute_still_raises(editor):
+    with pytest.raises(ValueError, match="Node not found"):
+        editor.get_node(tag="w:p", attrs={"w14:paraId": "00000000"})
+
+
+def _set_text(editor, text_elem, text):
+    if isinstance(editor, LxmlXMLEditor):
+        text_elem.text = text
+    else:
+        text_elem.firstChild.data = text
+
+
+def test_contains_lookup_sees_direct_text_edit(editor):
+    # Build the text index, then change a run's text behind its back
+    para = editor.get_node(tag="w:p", contains="quick brown")
+    _set_text(editor, para.getElementsByTagName("w:t")[0], "The slow red fox")
+
+    assert editor.get_node(tag="w:p", contains="slow red") is para
+    assert editor.get_node(tag="w:r", contains="slow red").parentNode is para
+    assert editor.find_nodes(tag="w:t", contains="slow red") != []
+
+
+def test_contains_lookup_drops_stale_text(editor):
+    para = editor.get_node(tag="w:p", contains="quick brown")
+    _set_text(editor, para.getElementsByTagName("w:t")[0], "The slow red fox")
+
+    assert editor.find_nodes(tag="w:p", contains="quick brown") == []
+
+
+def test_contains_lookup_finds_all_after_direct_text_edit(editor):
+    editor.get_node(tag="w:p", contains="lazy dog")
+    first = editor.get_node(tag="w:t", contains="quick brown")
+    _set_text(editor, first, "The lazy dog sleeps")
+
+    assert len(editor.find_nodes(tag="w:p", contains="lazy dog")) == 2
+
+
+def test_contains_lookup_sees_direct_remove_child(editor):
+    para = editor.get_node(tag="w:p", contains="lazy dog")
+    run = para.getElementsByTagName("w:r")[0]
+    if isinstance(editor, LxmlXMLEditor):
+        run.getparent().remove(run)
+    else:
+        run.parentNode.removeChild(run)
+
+    assert editor.find_nodes(tag="w:p", contains="lazy dog") == []
+
+
+def test_find_runs_spans_runs(editor):
+    (runs,) = editor.find_runs("Effective Date")
+    assert len(runs) == 2
+
+
+def test_find_runs_sees_direct_text_edit(editor):
+    assert editor.find_runs("lazy cat") == []
+    text = editor.get_node(tag="w:t", contains="lazy dog")
+    _set_text(editor, text, "Jumps over the lazy cat")
+
+    (runs,) = editor.find_runs("lazy cat")
+    assert runs == [text.parentNode]
+
+
+def test_save_if_changed_detects_direct_edits(editor):
+    inode = editor.xml_path.stat().st_ino
+    editor.get_node(tag="w:p", contains="quick brown")
+    assert not editor.save_if_changed()
+    assert editor.xml_path.stat().st_ino == inode
+
+    editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"}).setAttribute(
+        "w14:textId", "2ABCDEF0"
+    )
+    assert editor.save_if_changed()
+    assert 'w14:textId="2ABCDEF0"' in editor.xml_path.read_text()
+    assert not editor.save_if_changed()
+
+
+def test_save_if_changed_does_not_serialize_clean_minidom_editor(unpacked, monkeypatch):
+    editor = XMLEditor(unpacked / "word" / "document.xml")
+    editor.get_node(tag="w:p", contains="quick brown")
+    monkeypatch.setattr(editor, "_serialize", pytest.fail)
+
+    assert not editor.save_if_changed()
+
+
+def _children(elem):
+    return [c for c in elem.childNodes if c.nodeType == c.ELEMENT_NODE]
+
+
+def test_dom_methods_build_and_move_nodes(editor):
+    # The direct DOM calls shown in ooxml.md, on either engine
+    para = editor.get_node(tag="w:p", contains="quick brown")
+    run = para.getElementsByTagName("w:r")[0]
+    ins = editor.dom.createElement("w:ins")
+    ins.appendChild(run.cloneNode(True))
+    editor.insert_nodes_after(run, [ins])
+    assert _children(para) == [run, ins]
+    assert editor.get_node(tag="w:ins", contains="quick brown") is ins
+
+    parent = para.parentNode
+    parent.removeChild(para)
+    parent.appendChild(para)
+    assert _children(parent)[-1] is para
+
+    new_run = editor.dom.createElement("w:r")
+    assert para.replaceChild(new_run, ins) is ins
+    assert _children(para) == [run, new_run]
+
+
+def test_get_path_anchors_at_para_id(editor):
+    para = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000002"})
+    bold = para.getElementsByTagName("w:b")[0]
+    sect_pr = editor.dom.getElementsByTagName("w:sectPr")[0]
+
+    assert editor.get_path(para) == "#10000002"
+    assert editor.get_path(bold) == "#10000002/w:r[2]/w:rPr[1]/w:b[1]"
+    assert editor.get_path(sect_pr) == "/w:document[1]/w:body[1]/w:sectPr[1]"
+
+
+def test_get_node_by_path_round_trips_every_element(editor):
+    for elem in editor.dom.getElementsByTagName("*"):
+        assert editor.get_node_by_path(editor.get_path(elem)) is elem
+
+
+def test_get_node_by_path_survives_condensing(editor):
+    run = editor.get_node(tag="w:r", contains="Date")
+    path = editor.get_path(run)
+    condensed = condense_xml_bytes(editor.xml_path.read_bytes())
+    editor.xml_path.write_bytes(condensed)
+
+    reloaded = type(editor)(editor.xml_path)
+    assert reloaded._get_element_text(reloaded.get_node_by_path(path)) == "Date"
+
+
+@pytest.mark.parametrize(
+    "path, message",
+    [
+        ("#7FFFFFFF/w:r[1]", "Node not found"),
+        ("/w:document[1]/w:body[1]/w:p[9]", "No w:p\\[9\\]"),
+        ("/w:body[1]", "Root is <w:document>"),
+        ("#10000001/w:r[0]", "Bad step"),
+        ("w:p[1]", "Invalid path"),
+    ],
+)
+def test_get_node_by_path_errors(editor, path, message):
+    with pytest.raises(ValueError, match=message):
+        editor.get_node_by_path(path)
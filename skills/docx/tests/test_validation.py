@@ -0,0 +1,55 @@
+import pytest
+
+from ooxml.scripts.validation.base import BaseSchemaValidator
+
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+PRESENTATION = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<p:presentation xmlns:p="{P_NS}">
+  <p:sldMasterIdLst><p:sldMasterId id="2147483648"/></p:sldMasterIdLst>
+</p:presentation>
+"""
+
+SLIDE_MASTER = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<p:sldMaster xmlns:p="{P_NS}">
+  <p:sldLayoutIdLst><p:sldLayoutId id="{{layout_id}}"/></p:sldLayoutIdLst>
+</p:sldMaster>
+"""
+
+MASTER = "ppt/slideMasters/slideMaster1.xml"
+
+
+@pytest.fixture
+def package(tmp_path):
+    (tmp_path / "ppt" / "slideMasters").mkdir(parents=True)
+    (tmp_path / "ppt" / "presentation.xml").write_text(PRESENTATION)
+    return tmp_path
+
+
+def _unique_ids_valid(package, changed_files):
+    validator = BaseSchemaValidator(
+        package, package / "original.pptx", changed_files=changed_files
+    )
+    return validator.validate_unique_ids()
+
+
+@pytest.mark.parametrize(
+    "layout_id, valid", [("2147483649", True), ("2147483648", False)]
+)
+def test_incremental_unique_ids_match_full_validation(package, layout_id, valid):
+    (package / MASTER).write_text(SLIDE_MASTER.format(layout_id=layout_id))
+
+    assert _unique_ids_valid(package, None) is valid
+    assert _unique_ids_valid(package, [MASTER]) is valid
+
+
+def test_incremental_unique_ids_skip_unchanged_file_scope(package):
+    # A file-scope duplicate in an unchanged part is not re-reported
+    (package / MASTER).write_text(
+        SLIDE_MASTER.format(layout_id="2147483649").replace(
+            "</p:sldMaster>", '<p:sp id="1"/><p:sp id="1"/></p:sldMaster>'
+        )
+    )
+
+    assert not _unique_ids_valid(package, None)
+    assert _unique_ids_valid(package, ["ppt/presentation.xml"])